@@ -1,7 +1,34 @@
 from typing import List, Optional
 from datetime import datetime
+import asyncio
+import dataclasses
 import asyncpg
 from backend.core.config import settings
+from .types import (
+    SleepMetrics, NutritionMetrics, ExerciseMetrics,
+    BiometricMetrics, MoodMetrics
+)
+
+def _columns(cls) -> str:
+    # Select columns in the type's field order so rows can be passed
+    # positionally to the constructor
+    return ', '.join(f.name for f in dataclasses.fields(cls))
+
+SLEEP_COLUMNS = _columns(SleepMetrics)
+NUTRITION_COLUMNS = _columns(NutritionMetrics)
+EXERCISE_COLUMNS = _columns(ExerciseMetrics)
+BIOMETRIC_COLUMNS = _columns(BiometricMetrics)
+MOOD_COLUMNS = _columns(MoodMetrics)
+
+async def _init_connection(conn):
+    # Decode NUMERIC columns straight to float instead of decimal.Decimal
+    await conn.set_type_codec(
+        'numeric',
+        encoder=str,
+        decoder=float,
+        schema='pg_catalog',
+        format='text'
+    )
 
 class HealthRepository:
     def __init__(self):
@@ -9,7 +36,10 @@ class HealthRepository:
 
     async def init_pool(self):
         if not self.pool:
-            self.pool = await asyncpg.create_pool(settings.DATABASE_URL)
+            self.pool = await asyncpg.create_pool(
+                settings.DATABASE_URL,
+                init=_init_connection
+            )
 
     async def close(self):
         if self.pool:
@@ -30,8 +60,8 @@ class HealthRepository:
     ):
         async with self.pool.acquire() as conn:
             return await conn.fetch(
-                '''
-                SELECT * FROM sleep_metrics 
+                f'''
+                SELECT {SLEEP_COLUMNS} FROM sleep_metrics 
                 WHERE user_id = $1 
                 AND date BETWEEN $2 AND $3
                 ORDER BY date DESC
@@ -47,8 +77,8 @@ class HealthRepository:
     ):
         async with self.pool.acquire() as conn:
             return await conn.fetch(
-                '''
-                SELECT * FROM nutrition_metrics 
+                f'''
+                SELECT {NUTRITION_COLUMNS} FROM nutrition_metrics 
                 WHERE user_id = $1 
                 AND timestamp BETWEEN $2 AND $3
                 ORDER BY timestamp DESC
@@ -64,8 +94,8 @@ class HealthRepository:
     ):
         async with self.pool.acquire() as conn:
             return await conn.fetch(
-                '''
-                SELECT * FROM exercise_metrics 
+                f'''
+                SELECT {EXERCISE_COLUMNS} FROM exercise_metrics 
                 WHERE user_id = $1 
                 AND timestamp BETWEEN $2 AND $3
                 ORDER BY timestamp DESC
@@ -81,8 +111,8 @@ class HealthRepository:
     ):
         async with self.pool.acquire() as conn:
             return await conn.fetch(
-                '''
-                SELECT * FROM biometric_metrics 
+                f'''
+                SELECT {BIOMETRIC_COLUMNS} FROM biometric_metrics 
                 WHERE user_id = $1 
                 AND timestamp BETWEEN $2 AND $3
                 ORDER BY timestamp DESC
@@ -98,8 +128,8 @@ class HealthRepository:
     ):
         async with self.pool.acquire() as conn:
             return await conn.fetch(
-                '''
-                SELECT * FROM mood_metrics 
+                f'''
+                SELECT {MOOD_COLUMNS} FROM mood_metrics 
                 WHERE user_id = $1 
                 AND timestamp BETWEEN $2 AND $3
                 ORDER BY timestamp DESC
@@ -107,6 +137,29 @@ class HealthRepository:
                 user_id, start_date, end_date
             )
 
+    async def get_all_metrics(
+        self,
+        user_id: int,
+        start_date: datetime,
+        end_date: datetime
+    ):
+        # asyncpg does not allow concurrent queries on one connection, so the
+        # five range queries run on separate pooled connections in parallel.
+        sleep, nutrition, exercise, biometrics, mood = await asyncio.gather(
+            self.get_sleep_metrics(user_id, start_date, end_date),
+            self.get_nutrition_metrics(user_id, start_date, end_date),
+            self.get_exercise_metrics(user_id, start_date, end_date),
+            self.get_biometric_metrics(user_id, start_date, end_date),
+            self.get_mood_metrics(user_id, start_date, end_date)
+        )
+        return {
+            'sleep': sleep,
+            'nutrition': nutrition,
+            'exercise': exercise,
+            'biometrics': biometrics,
+            'mood': mood
+        }
+
     async def create_user(self, username: str, email: str):
         async with self.pool.acquire() as conn:
             return await conn.fetchrow(
@@ -1,9 +1,10 @@
 from typing import List, Optional
 import strawberry
+from strawberry.extensions import ParserCache, QueryDepthLimiter, ValidationCache
 from datetime import datetime
 from .types import (
     User, SleepMetrics, NutritionMetrics, ExerciseMetrics,
-    BiometricMetrics, MoodMetrics
+    BiometricMetrics, MoodMetrics, DashboardMetrics
 )
 from backend.core.inputs.health.providers import (
     apple_health, google_fit, myfitnesspal_adapter,
@@ -11,6 +12,10 @@ from backend.core.inputs.health.providers import (
 )
 from .repository import HealthRepository
 
+def records_to_objs(records, cls) -> list:
+    """Build metric objects positionally from rows selected in field order."""
+    return [cls(*r) for r in records]
+
 @strawberry.type
 class Query:
     @strawberry.field
@@ -31,7 +36,7 @@ class Query:
         await repo.init_pool()
         metrics = await repo.get_sleep_metrics(user_id, start_date, end_date)
         await repo.close()
-        return [SleepMetrics(**m) for m in metrics]
+        return records_to_objs(metrics, SleepMetrics)
 
     @strawberry.field
     async def nutrition_metrics(
@@ -43,7 +48,7 @@ class Query:
         await repo.init_pool()
         metrics = await repo.get_nutrition_metrics(user_id, start_date, end_date)
         await repo.close()
-        return [NutritionMetrics(**m) for m in metrics]
+        return records_to_objs(metrics, NutritionMetrics)
 
     @strawberry.field
     async def exercise_metrics(
@@ -55,7 +60,7 @@ class Query:
         await repo.init_pool()
         metrics = await repo.get_exercise_metrics(user_id, start_date, end_date)
         await repo.close()
-        return [ExerciseMetrics(**m) for m in metrics]
+        return records_to_objs(metrics, ExerciseMetrics)
 
     @strawberry.field
     async def biometric_metrics(
@@ -67,7 +72,7 @@ class Query:
         await repo.init_pool()
         metrics = await repo.get_biometric_metrics(user_id, start_date, end_date)
         await repo.close()
-        return [BiometricMetrics(**m) for m in metrics]
+        return records_to_objs(metrics, BiometricMetrics)
 
     @strawberry.field
     async def mood_metrics(
@@ -79,7 +84,25 @@ class Query:
         await repo.init_pool()
         metrics = await repo.get_mood_metrics(user_id, start_date, end_date)
         await repo.close()
-        return [MoodMetrics(**m) for m in metrics]
+        return records_to_objs(metrics, MoodMetrics)
+
+    @strawberry.field
+    async def dashboard_metrics(
+        self, user_id: int,
+        start_date: datetime,
+        end_date: datetime
+    ) -> DashboardMetrics:
+        repo = HealthRepository()
+        await repo.init_pool()
+        metrics = await repo.get_all_metrics(user_id, start_date, end_date)
+        await repo.close()
+        return DashboardMetrics(
+            sleep=records_to_objs(metrics['sleep'], SleepMetrics),
+            nutrition=records_to_objs(metrics['nutrition'], NutritionMetrics),
+            exercise=records_to_objs(metrics['exercise'], ExerciseMetrics),
+            biometrics=records_to_objs(metrics['biometrics'], BiometricMetrics),
+            mood=records_to_objs(metrics['mood'], MoodMetrics)
+        )
 
 @strawberry.type
 class Mutation:
@@ -128,4 +151,14 @@ class Mutation:
         await repo.close()
         return User(**user_data)
 
-schema = strawberry.Schema(query=Query, mutation=Mutation)
+schema = strawberry.Schema(
+    query=Query,
+    mutation=Mutation,
+    extensions=[
+        QueryDepthLimiter(max_depth=10),
+        # Dashboard clients resend the same documents; skip re-parsing and
+        # re-validating them on every request.
+        ParserCache(maxsize=128),
+        ValidationCache(maxsize=128),
+    ]
+)
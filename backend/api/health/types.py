@@ -1,7 +1,6 @@
 from datetime import datetime
 from typing import List, Optional
 import strawberry
-from decimal import Decimal
 
 @strawberry.type
 class User:
@@ -18,20 +17,20 @@ class SleepMetrics:
     date: datetime
     bedtime: str
     wake_time: str
-    total_sleep_duration: Optional[Decimal]
-    sleep_latency: Optional[Decimal]
-    deep_sleep_duration: Optional[Decimal]
-    rem_sleep_duration: Optional[Decimal]
-    light_sleep_duration: Optional[Decimal]
+    total_sleep_duration: Optional[float]
+    sleep_latency: Optional[float]
+    deep_sleep_duration: Optional[float]
+    rem_sleep_duration: Optional[float]
+    light_sleep_duration: Optional[float]
     wake_periods: Optional[int]
-    sleep_efficiency: Optional[Decimal]
-    room_temperature: Optional[Decimal]
-    room_humidity: Optional[Decimal]
-    noise_level: Optional[Decimal]
-    light_level: Optional[Decimal]
-    average_heart_rate: Optional[Decimal]
-    average_hrv: Optional[Decimal]
-    respiratory_rate: Optional[Decimal]
+    sleep_efficiency: Optional[float]
+    room_temperature: Optional[float]
+    room_humidity: Optional[float]
+    noise_level: Optional[float]
+    light_level: Optional[float]
+    average_heart_rate: Optional[float]
+    average_hrv: Optional[float]
+    respiratory_rate: Optional[float]
     sleep_quality_rating: Optional[int]
     morning_grogginess: Optional[int]
 
@@ -40,25 +39,25 @@ class NutritionMetrics:
     id: int
     user_id: int
     timestamp: datetime
-    calories: Optional[Decimal]
-    protein: Optional[Decimal]
-    carbohydrates: Optional[Decimal]
-    fiber: Optional[Decimal]
-    sugar: Optional[Decimal]
-    fat: Optional[Decimal]
-    saturated_fat: Optional[Decimal]
-    unsaturated_fat: Optional[Decimal]
+    calories: Optional[float]
+    protein: Optional[float]
+    carbohydrates: Optional[float]
+    fiber: Optional[float]
+    sugar: Optional[float]
+    fat: Optional[float]
+    saturated_fat: Optional[float]
+    unsaturated_fat: Optional[float]
     vitamins: Optional[dict]
     minerals: Optional[dict]
     meal_type: Optional[str]
     meal_time: Optional[str]
-    fasting_duration: Optional[Decimal]
+    fasting_duration: Optional[float]
     food_items: Optional[List[str]]
     meal_photos: Optional[List[str]]
-    water_intake: Optional[Decimal]
-    other_liquids: Optional[Decimal]
+    water_intake: Optional[float]
+    other_liquids: Optional[float]
     supplements: Optional[List[str]]
-    blood_glucose_response: Optional[Decimal]
+    blood_glucose_response: Optional[float]
 
 @strawberry.type
 class ExerciseMetrics:
@@ -66,51 +65,51 @@ class ExerciseMetrics:
     user_id: int
     timestamp: datetime
     activity_type: Optional[str]
-    duration: Optional[Decimal]
-    distance: Optional[Decimal]
-    average_heart_rate: Optional[Decimal]
-    max_heart_rate: Optional[Decimal]
-    calories_burned: Optional[Decimal]
+    duration: Optional[float]
+    distance: Optional[float]
+    average_heart_rate: Optional[float]
+    max_heart_rate: Optional[float]
+    calories_burned: Optional[float]
     exercises: Optional[dict]
-    total_volume: Optional[Decimal]
+    total_volume: Optional[float]
     one_rep_maxes: Optional[dict]
     perceived_exertion: Optional[int]
     fatigue_level: Optional[int]
     muscle_soreness: Optional[dict]
     heart_rate_zones: Optional[dict]
     power_output: Optional[dict]
-    vo2_max_estimate: Optional[Decimal]
-    temperature: Optional[Decimal]
-    humidity: Optional[Decimal]
-    altitude: Optional[Decimal]
+    vo2_max_estimate: Optional[float]
+    temperature: Optional[float]
+    humidity: Optional[float]
+    altitude: Optional[float]
 
 @strawberry.type
 class BiometricMetrics:
     id: int
     user_id: int
     timestamp: datetime
-    weight: Optional[Decimal]
-    body_fat_percentage: Optional[Decimal]
-    muscle_mass: Optional[Decimal]
-    bone_mass: Optional[Decimal]
-    water_percentage: Optional[Decimal]
-    waist: Optional[Decimal]
-    chest: Optional[Decimal]
-    hips: Optional[Decimal]
-    biceps: Optional[Decimal]
-    thighs: Optional[Decimal]
-    resting_heart_rate: Optional[Decimal]
-    blood_pressure_systolic: Optional[Decimal]
-    blood_pressure_diastolic: Optional[Decimal]
-    respiratory_rate: Optional[Decimal]
-    body_temperature: Optional[Decimal]
-    glucose_level: Optional[Decimal]
-    ketone_level: Optional[Decimal]
-    cholesterol_hdl: Optional[Decimal]
-    cholesterol_ldl: Optional[Decimal]
-    triglycerides: Optional[Decimal]
-    vo2_max: Optional[Decimal]
-    hrv_score: Optional[Decimal]
+    weight: Optional[float]
+    body_fat_percentage: Optional[float]
+    muscle_mass: Optional[float]
+    bone_mass: Optional[float]
+    water_percentage: Optional[float]
+    waist: Optional[float]
+    chest: Optional[float]
+    hips: Optional[float]
+    biceps: Optional[float]
+    thighs: Optional[float]
+    resting_heart_rate: Optional[float]
+    blood_pressure_systolic: Optional[float]
+    blood_pressure_diastolic: Optional[float]
+    respiratory_rate: Optional[float]
+    body_temperature: Optional[float]
+    glucose_level: Optional[float]
+    ketone_level: Optional[float]
+    cholesterol_hdl: Optional[float]
+    cholesterol_ldl: Optional[float]
+    triglycerides: Optional[float]
+    vo2_max: Optional[float]
+    hrv_score: Optional[float]
 
 @strawberry.type
 class MoodMetrics:
@@ -125,7 +124,15 @@ class MoodMetrics:
     mental_clarity: Optional[int]
     motivation_level: Optional[int]
     productivity_score: Optional[int]
-    flow_state_duration: Optional[Decimal]
+    flow_state_duration: Optional[float]
     weather_condition: Optional[str]
-    daylight_exposure: Optional[Decimal]
+    daylight_exposure: Optional[float]
     mood_notes: Optional[str]
+
+@strawberry.type
+class DashboardMetrics:
+    sleep: List[SleepMetrics]
+    nutrition: List[NutritionMetrics]
+    exercise: List[ExerciseMetrics]
+    biometrics: List[BiometricMetrics]
+    mood: List[MoodMetrics]
@@ -7,13 +7,13 @@ Typical usage example:
     uvicorn api:app --reload
 """
 
-from fastapi import FastAPI, WebSocket
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import List, Dict
 import numpy as np
 from eeg import Band, brain_read, init_buffers
-import json
+import orjson
 
 app = FastAPI(
     title="FlowState API",
@@ -98,12 +98,18 @@ async def websocket_endpoint(websocket: WebSocket):
         
     Notes:
         This endpoint accepts EEG data from the client, processes it, and sends back the calculated strobe pattern.
+        Binary frames are parsed directly; text frames are still accepted for older clients.
     """
     await websocket.accept()
     try:
         while True:
-            data = await websocket.receive_text()
-            brainwave_data = json.loads(data)
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+            data = message.get("bytes")
+            if data is None:
+                data = message["text"]
+            brainwave_data = orjson.loads(data)
             
             # Process the data and get strobe pattern
             focus_data = BrainwaveData(**brainwave_data)
@@ -118,4 +124,5 @@ async def websocket_endpoint(websocket: WebSocket):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # loop="auto" picks uvloop when it is installed (not available on Windows)
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="auto")
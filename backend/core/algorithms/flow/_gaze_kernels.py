@@ -0,0 +1,126 @@
+"""Numba kernels for gaze event segmentation.
+
+These kernels walk a window of gaze samples once and emit fixation,
+saccade and blink segments into preallocated output arrays, avoiding the
+intermediate arrays of a multi-pass NumPy implementation.
+"""
+
+import numpy as np
+from numba import njit
+
+FIXATION = 0
+SACCADE = 1
+BLINK = 2
+
+@njit(cache=True, fastmath=True)
+def segment_gaze(t, x, y, valid, v_thresh,
+                 out_starts, out_ends, out_kind, out_velocity):
+    """Segment gaze samples into fixations, saccades and blinks.
+
+    Fixations and saccades are runs of inter-sample intervals whose
+    endpoints are both valid, split on the velocity threshold. Blinks are
+    runs of invalid samples. Output arrays must hold at least len(t)
+    entries.
+
+    Args:
+        t: Sample timestamps in seconds
+        x: Horizontal gaze position in degrees
+        y: Vertical gaze position in degrees
+        valid: Non-zero where the tracker reported a valid sample
+        v_thresh: Saccade velocity threshold in deg/s
+        out_starts: Segment start sample indices
+        out_ends: Segment end sample indices (exclusive for blinks)
+        out_kind: Segment kind (FIXATION, SACCADE or BLINK)
+        out_velocity: Mean velocity of each fixation/saccade segment
+
+    Returns:
+        Number of segments written
+    """
+    n = t.shape[0]
+    count = 0
+    run_kind = -1
+    run_start = 0
+    run_velocity = 0.0
+    blink_start = -1
+
+    for i in range(n):
+        if valid[i] == 0:
+            if blink_start < 0:
+                blink_start = i
+        elif blink_start >= 0:
+            out_starts[count] = blink_start
+            out_ends[count] = i
+            out_kind[count] = BLINK
+            out_velocity[count] = 0.0
+            count += 1
+            blink_start = -1
+
+        if i == 0:
+            continue
+
+        velocity = 0.0
+        if valid[i] != 0 and valid[i - 1] != 0:
+            dt = t[i] - t[i - 1]
+            if dt > 0:
+                dx = x[i] - x[i - 1]
+                dy = y[i] - y[i - 1]
+                velocity = np.sqrt(dx * dx + dy * dy) / dt
+            kind = SACCADE if velocity > v_thresh else FIXATION
+        else:
+            kind = -1
+
+        if kind != run_kind:
+            if run_kind >= 0:
+                out_starts[count] = run_start
+                out_ends[count] = i - 1
+                out_kind[count] = run_kind
+                out_velocity[count] = run_velocity / (i - 1 - run_start)
+                count += 1
+            run_kind = kind
+            run_start = i - 1
+            run_velocity = 0.0
+        run_velocity += velocity
+
+    if run_kind >= 0:
+        out_starts[count] = run_start
+        out_ends[count] = n - 1
+        out_kind[count] = run_kind
+        out_velocity[count] = run_velocity / (n - 1 - run_start)
+        count += 1
+    if blink_start >= 0:
+        out_starts[count] = blink_start
+        out_ends[count] = n
+        out_kind[count] = BLINK
+        out_velocity[count] = 0.0
+        count += 1
+
+    return count
+
+@njit(cache=True)
+def filter_blinks(starts, ends, t, min_dur_s, out_starts, out_ends):
+    """Keep blink segments lasting at least min_dur_s seconds.
+
+    Every candidate is written unconditionally and the output cursor only
+    advances for blinks that pass, so noisy inputs do not cost a
+    mispredicted branch per candidate.
+
+    Args:
+        starts: Blink start sample indices
+        ends: Blink end sample indices (exclusive)
+        t: Sample timestamps in seconds
+        min_dur_s: Minimum blink duration in seconds
+        out_starts: Output start indices, at least len(starts) long
+        out_ends: Output end indices, at least len(starts) long
+
+    Returns:
+        Number of blinks kept
+    """
+    last = t.shape[0] - 1
+    k = 0
+    for i in range(starts.shape[0]):
+        s = starts[i]
+        e = ends[i]
+        out_starts[k] = s
+        out_ends[k] = e
+        k += int(t[min(e, last)] - t[s] >= min_dur_s)
+    return k
@@ -0,0 +1,31 @@
+"""Numba kernels for recovery scoring.
+
+Recovery metrics are computed from short HRV windows on every controller
+tick, where NumPy's per-call dispatch costs more than the arithmetic.
+These kernels fuse those reductions into a single compiled pass.
+"""
+
+import numpy as np
+from numba import njit
+
+@njit(cache=True)
+def coefficient_of_variation(x):
+    """Population std/mean of x in one pass (Welford's algorithm).
+
+    Args:
+        x: 1-D float64 array with at least one sample
+
+    Returns:
+        Coefficient of variation, or inf when the mean is zero
+    """
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    for v in x:
+        n += 1
+        d = v - mean
+        mean += d / n
+        m2 += d * (v - mean)
+    if mean == 0.0:
+        return np.inf
+    return np.sqrt(m2 / n) / mean
@@ -0,0 +1,10 @@
+"""Scalar helpers and constants shared by the flow control loops."""
+
+import math
+
+# 45-degree bilateral phase shift for enhanced synchronization
+BILATERAL_PHASE_DIFF = math.pi / 4
+
+def clip01(x: float) -> float:
+    """Clamp a scalar to [0, 1] without NumPy ufunc dispatch."""
+    return 0.0 if x < 0.0 else (1.0 if x > 1.0 else x)
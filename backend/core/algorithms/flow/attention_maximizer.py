@@ -18,8 +18,18 @@ import logging
 from biometric.tobii_tracker import TobiiTracker
 from visual.visual_processor import VisualStimulator
 from hardware.strobe_glasses import StrobeGlasses
+from core.algorithms.flow._gaze_kernels import (
+    segment_gaze, filter_blinks, FIXATION, SACCADE, BLINK
+)
+try:
+    # Ahead-of-time compiled build of the same kernel, when available
+    from core.algorithms.flow._gaze_cy import segment_gaze
+except ImportError:
+    pass
+from core.algorithms.flow.history import MetricHistory
+from core.algorithms.flow._util import BILATERAL_PHASE_DIFF, clip01
 
-@dataclass
+@dataclass(slots=True)
 class AttentionMetrics:
     """Container for attention-related metrics."""
     fixation_duration: float  # Average fixation duration in seconds
@@ -46,15 +56,18 @@ class AttentionDensityMaximizer:
         self.eye_tracker = eye_tracker
         self.visual_stim = visual_stim
         self.strobe_glasses = strobe_glasses
+        self._inv_max_pupil = 1.0 / eye_tracker.max_pupil_size
         
         # Configuration parameters
         self.attention_threshold = 0.7  # Minimum attention score
         self.distraction_threshold = 0.3  # Maximum distraction tolerance
         self.adaptation_rate = 0.1  # Rate of parameter adjustment
+        self.saccade_velocity_threshold = 30.0  # deg/s, I-VT saccade threshold
+        self.min_blink_duration = 0.1  # s, shorter dropouts are not blinks
         
         # State tracking
         self.baseline_attention: Optional[float] = None
-        self.attention_history: List[float] = []
+        self.attention_history = MetricHistory(capacity=256, window=10)
         self.distraction_zones: List[Tuple[float, float]] = []  # (x, y) coordinates
         
     async def compute_attention_metrics(self, window_size: float = 1.0) -> AttentionMetrics:
@@ -65,37 +78,40 @@ class AttentionDensityMaximizer:
             
         Returns:
             AttentionMetrics object with computed values
+            
+        Note:
+            Gaze data is expected as a dict of equal-length arrays with keys
+            't' (seconds), 'x', 'y' (degrees), 'pupil' and 'valid'. The
+            window is read from samples the tracker has already buffered,
+            so this does not block for window_size seconds.
         """
-        # Get raw eye tracking data
-        gaze_data = await self.eye_tracker.get_gaze_data(duration=window_size)
+        # Snapshot the tracker's ring buffer instead of waiting a full window
+        gaze_data = self.eye_tracker.snapshot_last(window_size)
         
-        # Extract basic metrics
-        fixations = self._extract_fixations(gaze_data)
-        saccades = self._extract_saccades(gaze_data)
+        # Extract basic metrics from a single segmentation pass
+        segments = self._segment_gaze(gaze_data)
+        fixations = self._extract_fixations(gaze_data, segments)
+        saccades = self._extract_saccades(gaze_data, segments)
         pupil_data = self._extract_pupil_data(gaze_data)
-        blinks = self._extract_blinks(gaze_data)
+        blinks = self._extract_blinks(gaze_data, segments)
         
         # Compute derived metrics
-        fixation_duration = np.mean([f.duration for f in fixations])
-        saccade_velocity = np.mean([s.velocity for s in saccades])
-        pupil_diameter = np.mean(pupil_data) / self.eye_tracker.max_pupil_size
+        fixation_duration = float(fixations.mean()) if fixations.size else 0.0
+        saccade_velocity = float(saccades.mean()) if saccades.size else 0.0
+        pupil_diameter = (
+            float(pupil_data.mean()) * self._inv_max_pupil
+            if pupil_data.size else 0.0
+        )
         blink_rate = len(blinks) * (60.0 / window_size)  # Convert to blinks/minute
         
-        # Compute attention score using multiple factors
-        attention_score = self._compute_attention_score(
+        # Compute attention score and cognitive load in one pass
+        attention_score, cognitive_load = self._compute_attention_and_load(
             fixation_duration=fixation_duration,
             saccade_velocity=saccade_velocity,
             pupil_diameter=pupil_diameter,
             blink_rate=blink_rate
         )
         
-        # Estimate cognitive load
-        cognitive_load = self._estimate_cognitive_load(
-            pupil_diameter=pupil_diameter,
-            blink_rate=blink_rate,
-            saccade_velocity=saccade_velocity
-        )
-        
         return AttentionMetrics(
             fixation_duration=fixation_duration,
             saccade_velocity=saccade_velocity,
@@ -105,69 +121,46 @@ class AttentionDensityMaximizer:
             cognitive_load=cognitive_load
         )
         
-    def _compute_attention_score(self,
-                               fixation_duration: float,
-                               saccade_velocity: float,
-                               pupil_diameter: float,
-                               blink_rate: float) -> float:
-        """Compute overall attention score from individual metrics.
+    def _compute_attention_and_load(self,
+                                    fixation_duration: float,
+                                    saccade_velocity: float,
+                                    pupil_diameter: float,
+                                    blink_rate: float) -> Tuple[float, float]:
+        """Compute attention score and cognitive load from eye metrics.
+        
+        Both scores are weighted combinations of the same normalized
+        inputs, so they share one normalization pass.
         
-        Uses a weighted combination of metrics, normalized to 0-1 range.
         Longer fixations, moderate saccade velocity, larger pupils, and
-        lower blink rates generally indicate higher attention.
+        lower blink rates generally indicate higher attention. Higher
+        cognitive load typically correlates with larger pupil diameter,
+        reduced blink rate and increased saccade velocity.
+        
+        Returns:
+            Tuple of (attention_score, cognitive_load), each in 0-1
         """
         # Normalize metrics to 0-1 range
-        norm_fixation = np.clip(fixation_duration / 0.3, 0, 1)  # 300ms is typical
-        norm_saccade = 1 - np.clip(saccade_velocity / 500, 0, 1)  # Lower is better
+        norm_fixation = clip01(fixation_duration / 0.3)  # 300ms is typical
+        norm_saccade = clip01(saccade_velocity / 500)
         norm_pupil = pupil_diameter  # Already normalized
-        norm_blink = 1 - np.clip(blink_rate / 30, 0, 1)  # Lower is better
-        
-        # Weighted combination
-        weights = {
-            'fixation': 0.4,
-            'saccade': 0.2,
-            'pupil': 0.3,
-            'blink': 0.1
-        }
+        norm_blink = 1.0 - clip01(blink_rate / 30)  # Lower is better
         
         attention_score = (
-            weights['fixation'] * norm_fixation +
-            weights['saccade'] * norm_saccade +
-            weights['pupil'] * norm_pupil +
-            weights['blink'] * norm_blink
+            0.4 * norm_fixation +
+            0.2 * (1.0 - norm_saccade) +  # Lower velocity is better
+            0.3 * norm_pupil +
+            0.1 * norm_blink
         )
-        
-        return float(np.clip(attention_score, 0, 1))
-        
-    def _estimate_cognitive_load(self,
-                               pupil_diameter: float,
-                               blink_rate: float,
-                               saccade_velocity: float) -> float:
-        """Estimate cognitive load from eye metrics.
-        
-        Higher cognitive load typically correlates with:
-        - Larger pupil diameter
-        - Reduced blink rate
-        - Increased saccade velocity
-        """
-        # Normalize and weight factors
-        pupil_load = pupil_diameter  # Already normalized
-        blink_load = 1 - np.clip(blink_rate / 30, 0, 1)  # Lower blink rate = higher load
-        saccade_load = np.clip(saccade_velocity / 500, 0, 1)  # Higher velocity = higher load
-        
-        weights = {
-            'pupil': 0.5,
-            'blink': 0.2,
-            'saccade': 0.3
-        }
-        
         cognitive_load = (
-            weights['pupil'] * pupil_load +
-            weights['blink'] * blink_load +
-            weights['saccade'] * saccade_load
+            0.5 * norm_pupil +
+            0.2 * norm_blink +  # Lower blink rate = higher load
+            0.3 * norm_saccade  # Higher velocity = higher load
         )
         
-        return float(np.clip(cognitive_load, 0, 1))
+        return (
+            clip01(attention_score),
+            clip01(cognitive_load)
+        )
         
     async def optimize_stimulation(self, current_eeg_phase: float):
         """Optimize visual stimulation based on attention metrics.
@@ -210,11 +203,10 @@ class AttentionDensityMaximizer:
         alpha_freq = 10 - (attention_deficit * 2)   # Decrease alpha for alertness
         
         # Set bilateral stimulation with phase difference
-        phase_diff = np.pi / 4  # 45-degree phase shift for enhanced synchronization
         await self.strobe_glasses.set_bilateral_strobing(
             left_freq=gamma_freq,
             right_freq=gamma_freq,
-            phase_diff=phase_diff,
+            phase_diff=BILATERAL_PHASE_DIFF,
             intensity=0.8
         )
         
@@ -250,22 +242,65 @@ class AttentionDensityMaximizer:
             duration=0.1
         )
         
-    def _extract_fixations(self, gaze_data: Dict) -> List[Dict]:
-        """Extract fixation events from raw gaze data."""
-        # Implementation depends on eye tracker data format
-        return []  # TODO: Implement fixation detection
-        
-    def _extract_saccades(self, gaze_data: Dict) -> List[Dict]:
-        """Extract saccade events from raw gaze data."""
-        # Implementation depends on eye tracker data format
-        return []  # TODO: Implement saccade detection
-        
-    def _extract_pupil_data(self, gaze_data: Dict) -> np.ndarray:
-        """Extract pupil diameter data."""
-        # Implementation depends on eye tracker data format
-        return np.array([])  # TODO: Implement pupil data extraction
-        
-    def _extract_blinks(self, gaze_data: Dict) -> List[Dict]:
-        """Extract blink events from raw gaze data."""
-        # Implementation depends on eye tracker data format
-        return []  # TODO: Implement blink detection
+    def _segment_gaze(self, gaze_data: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Segment a gaze window into fixation, saccade and blink events.
+        
+        Returns:
+            Dict of equal-length 'starts', 'ends', 'kind' and 'velocity' arrays
+        """
+        n = len(gaze_data['t'])
+        starts = np.empty(n, dtype=np.int32)
+        ends = np.empty(n, dtype=np.int32)
+        kind = np.empty(n, dtype=np.int8)
+        velocity = np.empty(n, dtype=np.float64)
+        count = segment_gaze(
+            np.ascontiguousarray(gaze_data['t'], dtype=np.float64),
+            np.ascontiguousarray(gaze_data['x'], dtype=np.float64),
+            np.ascontiguousarray(gaze_data['y'], dtype=np.float64),
+            np.ascontiguousarray(gaze_data['valid'], dtype=np.uint8),
+            self.saccade_velocity_threshold,
+            starts, ends, kind, velocity
+        )
+        return {
+            'starts': starts[:count],
+            'ends': ends[:count],
+            'kind': kind[:count],
+            'velocity': velocity[:count]
+        }
+        
+    def _extract_fixations(self, gaze_data: Dict[str, np.ndarray],
+                           segments: Dict[str, np.ndarray]) -> np.ndarray:
+        """Extract fixation durations (seconds) from segmented gaze data."""
+        mask = segments['kind'] == FIXATION
+        t = gaze_data['t']
+        return t[segments['ends'][mask]] - t[segments['starts'][mask]]
+        
+    def _extract_saccades(self, gaze_data: Dict[str, np.ndarray],
+                          segments: Dict[str, np.ndarray]) -> np.ndarray:
+        """Extract mean velocity of each saccade from segmented gaze data."""
+        return segments['velocity'][segments['kind'] == SACCADE]
+        
+    def _extract_pupil_data(self, gaze_data: Dict[str, np.ndarray]) -> np.ndarray:
+        """Extract pupil diameter samples where the tracker reported valid data."""
+        return gaze_data['pupil'][gaze_data['valid'].astype(bool)]
+        
+    def _extract_blinks(self, gaze_data: Dict[str, np.ndarray],
+                        segments: Dict[str, np.ndarray]) -> np.ndarray:
+        """Extract blink durations (seconds) from segmented gaze data.
+        
+        Runs of invalid samples shorter than min_blink_duration are treated
+        as tracking dropouts rather than blinks.
+        """
+        mask = segments['kind'] == BLINK
+        candidates_start = segments['starts'][mask]
+        candidates_end = segments['ends'][mask]
+        t = np.ascontiguousarray(gaze_data['t'], dtype=np.float64)
+        
+        starts = np.empty_like(candidates_start)
+        ends = np.empty_like(candidates_end)
+        count = filter_blinks(
+            candidates_start, candidates_end, t, self.min_blink_duration,
+            starts, ends
+        )
+        # Blink spans from its first invalid sample to the next valid one
+        return t[np.minimum(ends[:count], len(t) - 1)] - t[starts[:count]]
@@ -0,0 +1,86 @@
+"""Bounded metric history buffers.
+
+Control loops in the flow systems append one scalar per tick for the
+whole session. MetricHistory stores them in a fixed-size ring and keeps
+running sums over the most recent window, so memory stays bounded and
+the recent variance is available without slicing the history.
+"""
+
+import numpy as np
+
+class MetricHistory:
+    """Fixed-capacity ring buffer of scalar metric samples.
+
+    Attributes:
+        window: Number of most recent samples covered by window_variance()
+    """
+
+    def __init__(self, capacity: int = 256, window: int = 10):
+        """Initialize an empty history.
+
+        Args:
+            capacity: Maximum number of samples retained
+            window: Number of recent samples tracked for variance
+
+        Raises:
+            ValueError: If window exceeds capacity
+        """
+        if window > capacity:
+            raise ValueError("window must not exceed capacity")
+        self.window = window
+        self._capacity = capacity
+        self._data = np.zeros(capacity, dtype=np.float64)
+        self._index = 0
+        self._count = 0
+        self._window_sum = 0.0
+        self._window_sumsq = 0.0
+
+    def append(self, value: float) -> None:
+        """Add a sample, evicting the oldest one once the buffer is full."""
+        if self._count >= self.window:
+            # Sample leaving the variance window
+            old = self._data[(self._index - self.window) % self._capacity]
+            self._window_sum -= old
+            self._window_sumsq -= old * old
+        self._data[self._index] = value
+        self._window_sum += value
+        self._window_sumsq += value * value
+        self._index = (self._index + 1) % self._capacity
+        self._count += 1
+        if self._index == 0:
+            self._resync_window()
+
+    def _resync_window(self) -> None:
+        # Recompute the running sums once per lap so float error cannot drift
+        recent = self.recent(self.window)
+        self._window_sum = float(recent.sum())
+        self._window_sumsq = float(np.dot(recent, recent))
+
+    def __len__(self) -> int:
+        return min(self._count, self._capacity)
+
+    def window_variance(self) -> float:
+        """Population variance of the most recent window of samples.
+
+        Returns:
+            Variance, or 0.0 until a full window has been recorded
+        """
+        if self._count < self.window:
+            return 0.0
+        mean = self._window_sum / self.window
+        return max(self._window_sumsq / self.window - mean * mean, 0.0)
+
+    def recent(self, n: int) -> np.ndarray:
+        """Return up to n most recent samples, oldest first.
+
+        When the samples are contiguous in the ring this is a read-only
+        view into the buffer rather than a copy, so it only reflects the
+        history until the next append.
+        """
+        n = min(n, len(self))
+        start = self._index - n
+        if start >= 0:
+            view = self._data[start:self._index]
+            view.flags.writeable = False
+            return view
+        return np.concatenate((self._data[start:], self._data[:self._index]))
@@ -11,14 +11,33 @@ Key Features:
     - Adaptive rest scheduling
 """
 
+import array
+import asyncio
+import math
+import sqlite3
+import time
 import numpy as np
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from dataclasses import astuple, dataclass, fields
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
 import logging
 from datetime import datetime, timedelta
 from biometric.whoop_client import WhoopClient
 from hardware.strobe_glasses import StrobeGlasses
 from flow.stability_system import FlowStateStabilitySystem
+from core.algorithms.flow._recovery_kernels import coefficient_of_variation
+from core.algorithms.flow._util import clip01
+
+# Weights for (cognitive recovery, rest quality, recovery rate)
+READINESS_WEIGHTS = (0.4, 0.3, 0.3)
+# Plasticity decay exp(-hours / 2) tabulated over the first 8 hours after flow
+PLASTICITY_DECAY_HOURS = 8.0
+_PLASTICITY_DECAY = tuple(
+    math.exp(-(PLASTICITY_DECAY_HOURS * i / 255) / 2) for i in range(256)
+)
+_PLASTICITY_DECAY_SCALE = 255 / PLASTICITY_DECAY_HOURS
+# 60-degree bilateral phase shift for theta-gamma plasticity stimulation
+PLASTICITY_PHASE_DIFF = math.pi / 3
 
 @dataclass
 class RecoveryMetrics:
@@ -30,19 +49,28 @@ class RecoveryMetrics:
     integration_score: float  # Learning integration measure (0-1)
     readiness_score: float  # Readiness for next flow session (0-1)
 
+METRIC_COLUMNS = tuple(f.name for f in fields(RecoveryMetrics))
+
 class RecoveryAndIntegrationSystem:
     """Optimizes recovery and integration of flow state benefits."""
     
     def __init__(self,
                  stability_system: FlowStateStabilitySystem,
                  whoop_client: WhoopClient,
-                 strobe_glasses: StrobeGlasses):
+                 strobe_glasses: StrobeGlasses,
+                 cache_ttl: float = 2.0,
+                 metrics_db: Optional[Union[str, Path]] = None):
         """Initialize the recovery system.
         
         Args:
             stability_system: Flow state stability tracker
             whoop_client: Biometric data interface
             strobe_glasses: Visual stimulation control
+            cache_ttl: Seconds computed RecoveryMetrics are reused for
+            metrics_db: Optional SQLite file (e.g. ~/.flowstate/metrics.db)
+                that computed metrics are persisted to for session replay;
+                release it with close() or by using the system as a
+                context manager
         """
         self.stability_system = stability_system
         self.whoop_client = whoop_client
@@ -55,22 +83,133 @@ class RecoveryAndIntegrationSystem:
         
         # State tracking
         self.last_flow_end: Optional[datetime] = None
-        self.recovery_history: List[float] = []
+        # Score histories hold unboxed doubles for the whole session
+        self.recovery_history = array.array('d')
         self.session_durations: List[timedelta] = []
-        self.integration_scores: List[float] = []
+        self.integration_scores = array.array('d')
+        
+        # Short-lived cache so protocol calls in the same tick share one computation
+        self.cache_ttl = cache_ttl
+        self._cached_metrics: Optional[RecoveryMetrics] = None
+        self._cached_at = 0.0
+        self._metrics_lock = asyncio.Lock()
+        
+        # Per-minute metric snapshots on disk, if enabled
+        self._metrics_db: Optional[sqlite3.Connection] = None
+        if metrics_db is not None:
+            self._metrics_db = self._open_metrics_db(Path(metrics_db).expanduser())
+        
+        # Fixed stimulation patterns, built once
+        self._cooldown_packet = strobe_glasses.build_synchronized_packet(
+            frequencies=(10.0, 4.0),  # Alpha-theta for relaxation
+            eeg_phase=0.0,  # Phase not critical during cooldown
+            duration=0.5
+        )
+        self._maintain_packet = strobe_glasses.build_alternating_packet(
+            base_freq=10.0,  # Alpha
+            alt_freq=4.0,    # Theta
+            pattern_duration=1.0
+        )
         
     async def compute_recovery_metrics(self) -> RecoveryMetrics:
         """Compute current recovery and integration metrics.
         
+        Results are reused for cache_ttl seconds, and concurrent callers
+        wait on a single in-flight computation.
+        
         Returns:
             RecoveryMetrics object with current values
         """
-        # Get biometric data
-        hrv_data = await self.whoop_client.get_hrv()
-        recovery = await self.whoop_client.get_recovery()
+        async with self._metrics_lock:
+            if (self._cached_metrics is not None and
+                    time.monotonic() - self._cached_at < self.cache_ttl):
+                return self._cached_metrics
+                
+            metrics = await self._compute_recovery_metrics()
+            self._cached_metrics = metrics
+            self._cached_at = time.monotonic()
+            if self._metrics_db is not None:
+                await asyncio.to_thread(self._persist_metrics, datetime.now(), metrics)
+            return metrics
+            
+    def get_persisted_metrics(self, at: datetime,
+                              flow_end: Optional[datetime] = None) -> Optional[RecoveryMetrics]:
+        """Look up the metrics snapshot persisted for a given minute.
         
-        # Get stability metrics for context
-        stability_metrics = await self.stability_system.compute_stability_metrics()
+        Args:
+            at: Time of the snapshot; truncated to the minute
+            flow_end: Flow session end the snapshot belongs to
+                (defaults to last_flow_end)
+            
+        Returns:
+            RecoveryMetrics recorded for that minute, or None if persistence
+            is disabled or nothing was recorded
+        """
+        if self._metrics_db is None:
+            return None
+        if flow_end is None:
+            flow_end = self.last_flow_end
+        row = self._metrics_db.execute(
+            f"SELECT {', '.join(METRIC_COLUMNS)} FROM recovery_metrics "
+            "WHERE flow_end = ? AND minute = ?",
+            (self._flow_end_key(flow_end), self._minute_key(at))
+        ).fetchone()
+        return RecoveryMetrics(*row) if row else None
+        
+    def close(self) -> None:
+        """Close the metrics database; later metrics are no longer persisted."""
+        if self._metrics_db is not None:
+            self._metrics_db.close()
+            self._metrics_db = None
+            
+    def __enter__(self) -> "RecoveryAndIntegrationSystem":
+        return self
+        
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+        
+    @staticmethod
+    def _open_metrics_db(path: Path) -> sqlite3.Connection:
+        """Open the metrics database, creating the file and table if needed."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Writes run in a worker thread, serialized by _metrics_lock
+        conn = sqlite3.connect(path, check_same_thread=False)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS recovery_metrics ("
+            "flow_end TEXT NOT NULL, minute TEXT NOT NULL, "
+            + ", ".join(f"{name} REAL" for name in METRIC_COLUMNS) +
+            ", PRIMARY KEY (flow_end, minute))"
+        )
+        conn.commit()
+        return conn
+        
+    @staticmethod
+    def _minute_key(at: datetime) -> str:
+        return at.replace(second=0, microsecond=0).isoformat()
+        
+    @staticmethod
+    def _flow_end_key(flow_end: Optional[datetime]) -> str:
+        return flow_end.isoformat() if flow_end else ''
+        
+    def _persist_metrics(self, at: datetime, metrics: RecoveryMetrics):
+        """Store a metrics snapshot, replacing any earlier one that minute."""
+        self._metrics_db.execute(
+            f"INSERT OR REPLACE INTO recovery_metrics "
+            f"(flow_end, minute, {', '.join(METRIC_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * (len(METRIC_COLUMNS) + 2))})",
+            (self._flow_end_key(self.last_flow_end), self._minute_key(at),
+             *astuple(metrics))
+        )
+        self._metrics_db.commit()
+            
+    async def _compute_recovery_metrics(self) -> RecoveryMetrics:
+        """Fetch inputs and compute recovery metrics without caching."""
+        # Fetch biometric data and stability context concurrently
+        hrv_data, recovery, stability_metrics = await asyncio.gather(
+            self.whoop_client.get_hrv(),
+            self.whoop_client.get_recovery(),
+            self.stability_system.compute_stability_metrics()
+        )
         
         # Compute cognitive recovery
         cognitive_recovery = self._compute_cognitive_recovery(
@@ -118,6 +257,7 @@ class RecoveryAndIntegrationSystem:
     async def start_recovery_protocol(self):
         """Initiate post-flow recovery protocol."""
         self.last_flow_end = datetime.now()
+        self._cached_metrics = None  # Plasticity depends on last_flow_end
         
         # Get current metrics
         metrics = await self.compute_recovery_metrics()
@@ -166,13 +306,11 @@ class RecoveryAndIntegrationSystem:
                                  stability_metrics) -> float:
         """Compute cognitive recovery score."""
         # Weight recovery score with stability context
-        cognitive_recovery = (
+        return clip01(
             0.7 * recovery_score +
             0.3 * stability_metrics.recovery_capacity
         )
         
-        return float(np.clip(cognitive_recovery, 0, 1))
-        
     def _estimate_plasticity(self,
                           time_since_flow: Optional[timedelta],
                           recovery_score: float) -> float:
@@ -181,13 +319,17 @@ class RecoveryAndIntegrationSystem:
             return 0.5
             
         # Plasticity peaks immediately after flow and gradually declines
+        # 2-hour decay constant, interpolated from the table; flat past 8 hours
         hours_since_flow = time_since_flow.total_seconds() / 3600
-        time_factor = np.exp(-hours_since_flow / 2)  # 2-hour decay constant
+        pos = min(max(hours_since_flow, 0.0), PLASTICITY_DECAY_HOURS) * _PLASTICITY_DECAY_SCALE
+        i = min(int(pos), 254)
+        lo = _PLASTICITY_DECAY[i]
+        time_factor = lo + (pos - i) * (_PLASTICITY_DECAY[i + 1] - lo)
         
         # Combine with recovery score
         plasticity = (0.7 * time_factor) + (0.3 * recovery_score)
         
-        return float(np.clip(plasticity, 0, 1))
+        return clip01(plasticity)
         
     def _assess_rest_quality(self,
                           hrv_data: np.ndarray,
@@ -197,55 +339,48 @@ class RecoveryAndIntegrationSystem:
             return recovery  # Fall back to recovery score
             
         # Compute HRV stability as rest quality indicator
-        hrv_stability = 1.0 - np.std(hrv_data) / np.mean(hrv_data)
+        hrv_stability = 1.0 - coefficient_of_variation(
+            np.ascontiguousarray(hrv_data, dtype=np.float64)
+        )
         
         # Combine with recovery score
         rest_quality = (0.6 * hrv_stability) + (0.4 * recovery)
         
-        return float(np.clip(rest_quality, 0, 1))
+        return clip01(rest_quality)
         
     def _compute_recovery_rate(self) -> float:
         """Compute rate of recovery progress."""
-        if len(self.recovery_history) < 2:
+        window = self.recovery_history[-5:]
+        if len(window) < 2:
             return 0.5
             
-        # Calculate rate of change in recovery scores
-        recent_rates = np.diff(self.recovery_history[-5:]) if len(self.recovery_history) >= 5 else np.diff(self.recovery_history)
-        avg_rate = np.mean(recent_rates)
+        # Mean change over the last five scores; the diffs telescope
+        avg_rate = (window[-1] - window[0]) / (len(window) - 1)
         
         # Normalize to 0-1 range
         norm_rate = 0.5 + (avg_rate * 5)  # Scale factor of 5 for sensitivity
         
-        return float(np.clip(norm_rate, 0, 1))
+        return clip01(norm_rate)
         
     def _compute_integration_score(self,
                                 plasticity: float,
                                 rest_quality: float) -> float:
         """Compute learning integration score."""
         # Weight plasticity and rest quality
-        integration = (0.7 * plasticity) + (0.3 * rest_quality)
-        
-        return float(np.clip(integration, 0, 1))
+        return clip01((0.7 * plasticity) + (0.3 * rest_quality))
         
     def _compute_readiness(self,
                          cognitive_recovery: float,
                          rest_quality: float,
                          recovery_rate: float) -> float:
         """Compute readiness score for next flow session."""
-        weights = {
-            'recovery': 0.4,
-            'rest': 0.3,
-            'rate': 0.3
-        }
-        
-        readiness = (
-            weights['recovery'] * cognitive_recovery +
-            weights['rest'] * rest_quality +
-            weights['rate'] * recovery_rate
+        w_recovery, w_rest, w_rate = READINESS_WEIGHTS
+        return clip01(
+            w_recovery * cognitive_recovery +
+            w_rest * rest_quality +
+            w_rate * recovery_rate
         )
         
-        return float(np.clip(readiness, 0, 1))
-        
     def _time_since_last_flow(self) -> Optional[timedelta]:
         """Calculate time since last flow session ended."""
         if not self.last_flow_end:
@@ -255,11 +390,7 @@ class RecoveryAndIntegrationSystem:
     async def _run_cooldown_protocol(self, metrics: RecoveryMetrics):
         """Run post-flow cool-down protocol."""
         # Use gentle alpha stimulation for relaxation
-        await self.strobe_glasses.set_synchronized_pattern(
-            frequencies=(10.0, 4.0),  # Alpha-theta for relaxation
-            eeg_phase=0.0,  # Phase not critical during cooldown
-            duration=0.5
-        )
+        await self.strobe_glasses.send_raw(self._cooldown_packet)
         
     async def _enhance_plasticity(self,
                                metrics: RecoveryMetrics,
@@ -269,7 +400,7 @@ class RecoveryAndIntegrationSystem:
         await self.strobe_glasses.set_bilateral_strobing(
             left_freq=40.0,  # Gamma
             right_freq=6.0,  # Theta
-            phase_diff=np.pi/3,
+            phase_diff=PLASTICITY_PHASE_DIFF,
             intensity=0.7
         )
         
@@ -278,8 +409,4 @@ class RecoveryAndIntegrationSystem:
                               eeg_phase: float):
         """Maintain recovery state with minimal stimulation."""
         # Use gentle alpha stimulation
-        await self.strobe_glasses.set_alternating_pattern(
-            base_freq=10.0,  # Alpha
-            alt_freq=4.0,   # Theta
-            pattern_duration=1.0
-        )
+        await self.strobe_glasses.send_raw(self._maintain_packet)
@@ -10,6 +10,7 @@ Key Features:
     - Environmental optimization
 """
 
+import asyncio
 import numpy as np
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
@@ -18,8 +19,15 @@ from biometric.tobii_tracker import TobiiTracker
 from biometric.whoop_client import WhoopClient
 from hardware.strobe_glasses import StrobeGlasses
 from attention.attention_maximizer import AttentionDensityMaximizer
+from core.algorithms.flow.history import MetricHistory
+from core.algorithms.flow._util import BILATERAL_PHASE_DIFF, clip01
 
-@dataclass
+# Weights for (attention, load optimality, HRV coherence)
+FLOW_DEPTH_WEIGHTS = (0.4, 0.3, 0.3)
+# Weights for (flow depth, attention stability, physiological stability)
+STABILITY_WEIGHTS = (0.4, 0.3, 0.3)
+
+@dataclass(slots=True)
 class StabilityMetrics:
     """Container for flow stability metrics."""
     flow_depth: float  # Current depth of flow state (0-1)
@@ -53,35 +61,37 @@ class FlowStateStabilitySystem:
         self.challenge_increment = 0.1  # Step size for challenge increases
         
         # State tracking
-        self.flow_history: List[float] = []
-        self.challenge_history: List[float] = []
+        self.flow_history = MetricHistory(capacity=256, window=10)
+        self.challenge_history = MetricHistory(capacity=256, window=10)
         self.current_challenge = 0.5  # Start at moderate challenge
         
+        # Fixed stimulation patterns, built once
+        self._maintain_packet = strobe_glasses.build_alternating_packet(
+            base_freq=35.0,  # Moderate gamma
+            alt_freq=8.0,    # Alpha for stability
+            pattern_duration=0.5
+        )
+        
     async def compute_stability_metrics(self) -> StabilityMetrics:
         """Compute current flow state stability metrics.
         
         Returns:
             StabilityMetrics object with current values
         """
-        # Get biometric data
-        hrv_data = await self.whoop_client.get_hrv()
-        recovery = await self.whoop_client.get_recovery()
-        
-        # Get attention metrics
-        attention_metrics = await self.attention_maximizer.compute_attention_metrics()
+        # Fetch biometric data and attention metrics concurrently
+        hrv_data, recovery, attention_metrics = await asyncio.gather(
+            self.whoop_client.get_hrv(),
+            self.whoop_client.get_recovery(),
+            self.attention_maximizer.compute_attention_metrics()
+        )
         
-        # Compute flow depth from multiple indicators
-        flow_depth = self._compute_flow_depth(
+        # Flow depth, stability and recovery capacity in one scoring pass
+        flow_depth, stability_score, recovery_capacity = self._compute_composite_scores(
             attention_score=attention_metrics.attention_score,
             cognitive_load=attention_metrics.cognitive_load,
-            hrv_coherence=self._compute_hrv_coherence(hrv_data)
-        )
-        
-        # Compute stability score
-        stability_score = self._compute_stability_score(
-            flow_depth=flow_depth,
+            hrv_variation=self._compute_hrv_variation(hrv_data),
             attention_stability=self._compute_attention_stability(attention_metrics),
-            physiological_stability=self._compute_physiological_stability(hrv_data)
+            recovery_score=recovery
         )
         
         # Assess environmental quality
@@ -89,12 +99,6 @@ class FlowStateStabilitySystem:
             attention_metrics=attention_metrics
         )
         
-        # Calculate recovery capacity
-        recovery_capacity = self._compute_recovery_capacity(
-            recovery_score=recovery,
-            cognitive_load=attention_metrics.cognitive_load
-        )
-        
         return StabilityMetrics(
             flow_depth=flow_depth,
             stability_score=stability_score,
@@ -125,47 +129,52 @@ class FlowStateStabilitySystem:
         else:
             await self._maintain_state(metrics, eeg_phase)
             
-    def _compute_flow_depth(self,
-                          attention_score: float,
-                          cognitive_load: float,
-                          hrv_coherence: float) -> float:
-        """Compute current depth of flow state from multiple indicators."""
+    def _compute_composite_scores(self,
+                                  attention_score: float,
+                                  cognitive_load: float,
+                                  hrv_variation: Optional[float],
+                                  attention_stability: float,
+                                  recovery_score: float) -> Tuple[float, float, float]:
+        """Compute flow depth, stability score and recovery capacity.
+        
+        The three scores are short weighted sums over overlapping inputs,
+        so they are computed together rather than through separate helpers.
+        
+        Returns:
+            Tuple of (flow_depth, stability_score, recovery_capacity), each 0-1
+        """
+        # HRV coherence and physiological stability both derive from the
+        # HRV coefficient of variation
+        if hrv_variation is None:
+            hrv_coherence = 0.5
+            physiological_stability = 1.0
+        else:
+            # Simplified coherence; in practice this would use frequency analysis
+            hrv_coherence = physiological_stability = clip01(1.0 - hrv_variation)
+        
         # Optimal cognitive load is around 0.7-0.8
         load_optimality = 1.0 - abs(0.75 - cognitive_load) * 2
         
-        # Weight and combine factors
-        weights = {
-            'attention': 0.4,
-            'load': 0.3,
-            'hrv': 0.3
-        }
-        
-        flow_depth = (
-            weights['attention'] * attention_score +
-            weights['load'] * load_optimality +
-            weights['hrv'] * hrv_coherence
+        w_attention, w_load, w_hrv = FLOW_DEPTH_WEIGHTS
+        flow_depth = clip01(
+            w_attention * attention_score +
+            w_load * load_optimality +
+            w_hrv * hrv_coherence
         )
         
-        return float(np.clip(flow_depth, 0, 1))
-        
-    def _compute_stability_score(self,
-                               flow_depth: float,
-                               attention_stability: float,
-                               physiological_stability: float) -> float:
-        """Compute overall stability score from multiple factors."""
-        weights = {
-            'flow': 0.4,
-            'attention': 0.3,
-            'physiological': 0.3
-        }
+        w_flow, w_stability, w_physiological = STABILITY_WEIGHTS
+        stability_score = clip01(
+            w_flow * flow_depth +
+            w_stability * attention_stability +
+            w_physiological * physiological_stability
+        )
         
-        stability = (
-            weights['flow'] * flow_depth +
-            weights['attention'] * attention_stability +
-            weights['physiological'] * physiological_stability
+        # Combine recovery score with inverse of cognitive load
+        recovery_capacity = clip01(
+            recovery_score * 0.7 + (1 - cognitive_load) * 0.3
         )
         
-        return float(np.clip(stability, 0, 1))
+        return flow_depth, stability_score, recovery_capacity
         
     def _compute_attention_stability(self, metrics) -> float:
         """Compute stability of attention metrics over time."""
@@ -173,31 +182,26 @@ class FlowStateStabilitySystem:
             return 1.0
             
         # Calculate variance in recent attention scores
-        recent_variance = np.var(self.flow_history[-10:]) if len(self.flow_history) >= 10 else 0
+        recent_variance = self.flow_history.window_variance()
         stability = 1.0 - recent_variance
         
-        return float(np.clip(stability, 0, 1))
+        return clip01(stability)
         
-    def _compute_physiological_stability(self, hrv_data: np.ndarray) -> float:
-        """Compute stability of physiological metrics."""
-        if len(hrv_data) < 2:
-            return 1.0
-            
-        # Calculate HRV stability
-        hrv_stability = 1.0 - np.std(hrv_data) / np.mean(hrv_data)
+    def _compute_hrv_variation(self, hrv_data: np.ndarray) -> Optional[float]:
+        """Compute the coefficient of variation of HRV samples.
         
-        return float(np.clip(hrv_stability, 0, 1))
-        
-    def _compute_hrv_coherence(self, hrv_data: np.ndarray) -> float:
-        """Compute HRV coherence score."""
+        Returns:
+            std/mean of the samples, or None with fewer than two samples
+            or a zero mean
+        """
         if len(hrv_data) < 2:
-            return 0.5
+            return None
             
-        # Simplified coherence calculation
-        # In practice, this would use more sophisticated frequency analysis
-        coherence = 1.0 - np.std(hrv_data) / np.mean(hrv_data)
-        
-        return float(np.clip(coherence, 0, 1))
+        hrv = np.asarray(hrv_data, dtype=np.float64)
+        mean = hrv.mean()
+        if mean == 0:
+            return None
+        return float(np.sqrt(np.square(hrv - mean).mean()) / mean)
         
     def _assess_environment(self, attention_metrics) -> float:
         """Assess quality of environmental conditions."""
@@ -205,16 +209,7 @@ class FlowStateStabilitySystem:
         # In practice, would incorporate actual environmental sensors
         environmental_score = attention_metrics.attention_score
         
-        return float(np.clip(environmental_score, 0, 1))
-        
-    def _compute_recovery_capacity(self,
-                                recovery_score: float,
-                                cognitive_load: float) -> float:
-        """Compute remaining cognitive recovery capacity."""
-        # Combine recovery score with inverse of cognitive load
-        capacity = (recovery_score * 0.7) + ((1 - cognitive_load) * 0.3)
-        
-        return float(np.clip(capacity, 0, 1))
+        return clip01(environmental_score)
         
     async def _stabilize_state(self,
                              metrics: StabilityMetrics,
@@ -241,7 +236,7 @@ class FlowStateStabilitySystem:
         await self.strobe_glasses.set_bilateral_strobing(
             left_freq=40.0,  # High gamma for enhanced focus
             right_freq=40.0,
-            phase_diff=np.pi/4,
+            phase_diff=BILATERAL_PHASE_DIFF,
             intensity=0.9
         )
         
@@ -251,8 +246,4 @@ class FlowStateStabilitySystem:
         """Maintain current flow state with minimal adjustments."""
         # Keep current challenge level
         # Use alternating pattern for sustained engagement
-        await self.strobe_glasses.set_alternating_pattern(
-            base_freq=35.0,  # Moderate gamma
-            alt_freq=8.0,    # Alpha for stability
-            pattern_duration=0.5
-        )
+        await self.strobe_glasses.send_raw(self._maintain_packet)
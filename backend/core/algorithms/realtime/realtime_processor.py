@@ -43,7 +43,8 @@ from collections import deque
 import logging
 from numba import jit
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+import os
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
 @dataclass
 class EEGBuffer:
@@ -77,6 +78,61 @@ class ArtifactParams:
     flatline_duration: int = 100
     noise_threshold: float = 0.8
 
+# Worker processes shared by every RealtimeEEGProcessor that offloads
+# feature extraction; created on first use, shut down with the last user
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_users = 0
+
+def _acquire_process_pool() -> ProcessPoolExecutor:
+    """Return the shared feature pool, creating it if needed."""
+    global _process_pool, _process_pool_users
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    _process_pool_users += 1
+    return _process_pool
+
+def _release_process_pool() -> None:
+    """Drop one user of the shared pool, shutting it down after the last."""
+    global _process_pool, _process_pool_users
+    _process_pool_users -= 1
+    if _process_pool_users <= 0 and _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+        _process_pool_users = 0
+
+def _compute_spectral_features(filtered: Dict[str, np.ndarray]) -> Dict[str, float]:
+    """Compute Hilbert-based band features for one buffer of filtered data.
+    
+    Kept at module level so it can be pickled and run in a worker process.
+    
+    Args:
+        filtered: Band-filtered EEG data keyed by band name
+        
+    Returns:
+        Dict of band powers, theta-gamma coupling and alpha-beta sync
+    """
+    # Calculate band powers
+    powers = {
+        band: float(np.mean(np.abs(hilbert_data)**2))
+        for band, hilbert_data in filtered.items()
+    }
+    
+    # Calculate cross-frequency coupling
+    theta_phase = np.angle(signal.hilbert(filtered['theta']))
+    gamma_amp = np.abs(signal.hilbert(filtered['gamma']))
+    coupling = np.abs(np.mean(gamma_amp * np.exp(1j * theta_phase)))
+    
+    # Calculate phase synchronization
+    alpha_phase = np.angle(signal.hilbert(filtered['alpha']))
+    beta_phase = np.angle(signal.hilbert(filtered['beta']))
+    sync = 1 - np.std(np.mod(alpha_phase - beta_phase, 2*np.pi))
+    
+    return {
+        **powers,
+        'theta_gamma_coupling': float(coupling),
+        'alpha_beta_sync': float(sync)
+    }
+
 class RealtimeEEGProcessor:
     """Real-time EEG signal processing and analysis.
     
@@ -85,13 +141,18 @@ class RealtimeEEGProcessor:
     """
     
     def __init__(self, channels: List[str], sampling_rate: int,
-                 buffer_duration: float = 4.0):
+                 buffer_duration: float = 4.0,
+                 offload_features: bool = False):
         """Initialize the EEG processor.
         
         Args:
             channels: List of EEG channel names
             sampling_rate: Sampling rate in Hz
             buffer_duration: Duration of data to buffer (seconds)
+            offload_features: Run Hilbert feature extraction in a shared
+                worker process pool so it does not block the event loop.
+                Worth it only for long buffers, where the FFTs cost more
+                than pickling the filtered data. Call close() when done.
         """
         self.channels = channels
         self.sampling_rate = sampling_rate
@@ -103,18 +164,21 @@ class RealtimeEEGProcessor:
         )
         self.artifact_params = ArtifactParams()
         self.thread_pool = ThreadPoolExecutor(max_workers=2)
+        self.offload_features = offload_features
+        self._process_pool: Optional[ProcessPoolExecutor] = None
         
         # Initialize filters
         self._init_filters()
         
     def _init_filters(self) -> None:
-        """Initialize filter coefficients for different frequency bands."""
+        """Initialize second-order-section filters for different frequency bands."""
+        fs = self.sampling_rate
         self.filters = {
-            'theta': signal.butter(3, [4, 8], 'bandpass', fs=self.sampling_rate),
-            'alpha': signal.butter(3, [8, 13], 'bandpass', fs=self.sampling_rate),
-            'beta': signal.butter(3, [13, 30], 'bandpass', fs=self.sampling_rate),
-            'gamma': signal.butter(3, [30, 100], 'bandpass', fs=self.sampling_rate),
-            'line_noise': signal.butter(3, [48, 52], 'bandstop', fs=self.sampling_rate)
+            'theta': signal.butter(3, [4, 8], 'bandpass', fs=fs, output='sos'),
+            'alpha': signal.butter(3, [8, 13], 'bandpass', fs=fs, output='sos'),
+            'beta': signal.butter(3, [13, 30], 'bandpass', fs=fs, output='sos'),
+            'gamma': signal.butter(3, [30, 100], 'bandpass', fs=fs, output='sos'),
+            'line_noise': signal.butter(3, [48, 52], 'bandstop', fs=fs, output='sos')
         }
 
     @jit(nopython=True)
@@ -165,7 +229,7 @@ class RealtimeEEGProcessor:
             - Feature extraction
         """
         # Remove line noise
-        denoised = signal.filtfilt(*self.filters['line_noise'], data)
+        denoised = signal.sosfiltfilt(self.filters['line_noise'], data, axis=-1)
         
         # Detect artifacts
         clean_mask = await asyncio.get_event_loop().run_in_executor(
@@ -174,9 +238,10 @@ class RealtimeEEGProcessor:
         
         # Apply filters to clean data
         filtered = {}
-        for band, (b, a) in self.filters.items():
+        clean = denoised * clean_mask
+        for band, sos in self.filters.items():
             if band != 'line_noise':
-                filtered[band] = signal.filtfilt(b, a, denoised * clean_mask)
+                filtered[band] = signal.sosfiltfilt(sos, clean, axis=-1)
         
         # Update buffer
         self.buffer.data.append(denoised)
@@ -201,32 +266,34 @@ class RealtimeEEGProcessor:
         data = np.array(list(self.buffer.data))
         filtered = self.buffer.filtered_data
         
-        # Calculate band powers
-        powers = {
-            band: np.mean(np.abs(hilbert_data)**2)
-            for band, hilbert_data in filtered.items()
-        }
-        
-        # Calculate cross-frequency coupling
-        theta_phase = np.angle(signal.hilbert(filtered['theta']))
-        gamma_amp = np.abs(signal.hilbert(filtered['gamma']))
-        coupling = np.abs(np.mean(gamma_amp * np.exp(1j * theta_phase)))
-        
-        # Calculate phase synchronization
-        alpha_phase = np.angle(signal.hilbert(filtered['alpha']))
-        beta_phase = np.angle(signal.hilbert(filtered['beta']))
-        sync = 1 - np.std(np.mod(alpha_phase - beta_phase, 2*np.pi))
+        # Hilbert transforms dominate here; keep them off the event loop
+        if self.offload_features:
+            if self._process_pool is None:
+                self._process_pool = _acquire_process_pool()
+            spectral = await asyncio.get_event_loop().run_in_executor(
+                self._process_pool, _compute_spectral_features, filtered
+            )
+        else:
+            spectral = _compute_spectral_features(filtered)
         
         # Combine features
         features = {
-            **powers,
-            'theta_gamma_coupling': coupling,
-            'alpha_beta_sync': sync,
+            **spectral,
             'signal_quality': np.mean(self._detect_artifacts(data))
         }
         
         return features
 
+    def close(self) -> None:
+        """Shut down this processor's executors.
+        
+        The shared feature pool is shut down once no processor uses it.
+        """
+        self.thread_pool.shutdown(wait=False)
+        if self._process_pool is not None:
+            self._process_pool = None
+            _release_process_pool()
+
     async def run_pipeline(self, data_stream: asyncio.Queue) -> None:
         """Run the complete processing pipeline on streaming data.
         
@@ -11,6 +11,7 @@ Hardware Requirements:
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 import asyncio
 import serial
 import logging
@@ -28,6 +29,35 @@ class StrobeConfig:
     pwm_frequency: int = 10000   # Hz
     phase_precision: float = 0.001  # Phase precision in radians
 
+@lru_cache(maxsize=32)
+def _alternating_packet(base_freq: float,
+                        alt_freq: float,
+                        pattern_duration: float,
+                        pwm_frequency: int) -> bytes:
+    """Build the ALT_PATTERN command and PWM payload for one configuration.
+    
+    The pattern depends only on its arguments, so packets for the handful
+    of configurations used by the control loops are built once and reused.
+    """
+    # Calculate number of samples for the pattern
+    num_samples = int(pattern_duration * pwm_frequency)
+    
+    # Generate alternating pattern
+    t = np.linspace(0, pattern_duration, num_samples)
+    envelope = 0.5 * (1 + np.sin(2 * np.pi * alt_freq * t))
+    carrier = np.sin(2 * np.pi * base_freq * t)
+    
+    # Create complementary patterns for each eye
+    left_pattern = envelope * carrier
+    right_pattern = (1 - envelope) * carrier
+    
+    # Convert to PWM values (0-255)
+    left_pwm = ((left_pattern + 1) * 127.5).astype(np.uint8)
+    right_pwm = ((right_pattern + 1) * 127.5).astype(np.uint8)
+    
+    command = f"ALT_PATTERN {num_samples}\n".encode()
+    return command + left_pwm.tobytes() + right_pwm.tobytes()
+
 class StrobeGlasses:
     """Interface for controlling strobe glasses hardware with bilateral stimulation."""
     
@@ -126,26 +156,39 @@ class StrobeGlasses:
         if not self.serial:
             raise RuntimeError("Not connected to strobe glasses")
             
-        # Calculate number of samples for the pattern
-        num_samples = int(pattern_duration * self.config.pwm_frequency)
+        await self.send_raw(
+            self.build_alternating_packet(base_freq, alt_freq, pattern_duration)
+        )
         
-        # Generate alternating pattern
-        t = np.linspace(0, pattern_duration, num_samples)
-        envelope = 0.5 * (1 + np.sin(2 * np.pi * alt_freq * t))
+    def build_alternating_packet(self,
+                                 base_freq: float,
+                                 alt_freq: float,
+                                 pattern_duration: float = 1.0) -> bytes:
+        """Build (or fetch from cache) an alternating pattern packet.
         
-        # Create complementary patterns for each eye
-        left_pattern = envelope * np.sin(2 * np.pi * base_freq * t)
-        right_pattern = (1 - envelope) * np.sin(2 * np.pi * base_freq * t)
+        Args:
+            base_freq: Base frequency for alternation in Hz
+            alt_freq: Alternation frequency between eyes in Hz
+            pattern_duration: Duration of each alternation cycle in seconds
+            
+        Returns:
+            Serial packet ready for send_raw()
+        """
+        return _alternating_packet(
+            float(base_freq), float(alt_freq), float(pattern_duration),
+            self.config.pwm_frequency
+        )
         
-        # Convert to PWM values (0-255)
-        left_pwm = ((left_pattern + 1) * 127.5).astype(np.uint8)
-        right_pwm = ((right_pattern + 1) * 127.5).astype(np.uint8)
+    async def send_raw(self, packet: bytes):
+        """Write a prebuilt command packet to the glasses.
         
-        # Send alternating pattern command
-        command = f"ALT_PATTERN {num_samples}\n"
-        self.serial.write(command.encode())
-        self.serial.write(left_pwm.tobytes())
-        self.serial.write(right_pwm.tobytes())
+        Args:
+            packet: Packet from one of the build_*_packet methods
+        """
+        if not self.serial:
+            raise RuntimeError("Not connected to strobe glasses")
+            
+        self.serial.write(packet)
         
     async def set_synchronized_pattern(self, 
                                      frequencies: Tuple[float, float],
@@ -161,6 +204,27 @@ class StrobeGlasses:
         if not self.serial:
             raise RuntimeError("Not connected to strobe glasses")
             
+        await self.send_raw(
+            self.build_synchronized_packet(frequencies, eeg_phase, duration)
+        )
+        
+    def build_synchronized_packet(self,
+                                  frequencies: Tuple[float, float],
+                                  eeg_phase: float,
+                                  duration: float = 0.1) -> bytes:
+        """Build a synchronized pattern packet.
+        
+        Callers that always use the same frequencies and phase can build
+        the packet once and replay it with send_raw().
+        
+        Args:
+            frequencies: Tuple of (carrier_freq, modulation_freq) in Hz
+            eeg_phase: EEG phase in radians for synchronization
+            duration: Pattern duration in seconds
+            
+        Returns:
+            Serial packet ready for send_raw()
+        """
         carrier_freq, mod_freq = frequencies
         
         # Generate synchronized pattern using visual stimulator
@@ -179,10 +243,8 @@ class StrobeGlasses:
         # Convert to PWM values (0-255)
         pwm_values = (np.clip(pattern, 0, 1) * 255).astype(np.uint8)
         
-        # Send synchronized pattern to glasses
-        command = f"SYNC_PATTERN {len(pwm_values)}\n"
-        self.serial.write(command.encode())
-        self.serial.write(pwm_values.tobytes())
+        command = f"SYNC_PATTERN {len(pwm_values)}\n".encode()
+        return command + pwm_values.tobytes()
         
     async def start_entrainment(self, eeg_phase: float):
         """Start neural entrainment based on EEG phase.
@@ -0,0 +1,30 @@
+"""Numba kernels for EEG signal filtering.
+
+The Muse stream is notch filtered on every chunk, a few samples at a time
+across a handful of channels, where SciPy's per-call dispatch costs more
+than the filter itself. This kernel runs the whole cascade in one
+compiled pass over all channels.
+"""
+
+from numba import njit
+
+@njit(cache=True, fastmath=True)
+def sos_filter_inplace(x, sos, zi):
+    """Filter x in place through cascaded biquads (transposed direct form II).
+
+    Args:
+        x: 2-D array (samples x channels), overwritten with the output
+        sos: Second-order sections (sections x 6) as from scipy.signal.butter
+            with output='sos', normalized so a0 == 1
+        zi: Filter state (sections x 2 x channels), updated in place
+    """
+    n_sections = sos.shape[0]
+    for t in range(x.shape[0]):
+        for c in range(x.shape[1]):
+            v = x[t, c]
+            for s in range(n_sections):
+                y = sos[s, 0] * v + zi[s, 0, c]
+                zi[s, 0, c] = sos[s, 1] * v - sos[s, 4] * y + zi[s, 1, c]
+                zi[s, 1, c] = sos[s, 2] * v - sos[s, 5] * y
+                v = y
+            x[t, c] = v
@@ -29,19 +29,76 @@ Example:
     ...         return normalized_sleep_data
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Dict, List, Optional
+import numpy as np
 import pandas as pd
 
+# Minutes per unit accepted by HealthDataProvider.normalize_duration
+_DURATION_TO_MINUTES: Dict[str, float] = {
+    'seconds': 1.0 / 60.0,
+    'minutes': 1.0,
+    'hours': 60.0
+}
+
+DAY_NS = 86_400 * 10**9
+
+def aggregate_daily(df: pd.DataFrame, column: str, how: str, days: pd.DatetimeIndex) -> np.ndarray:
+    """Aggregate a timestamped column into the 24-hour bins starting at each of days.
+    
+    Bins start at days[0], matching the [date, date + 1 day) windows of
+    pd.date_range. NaN values and NaT or out-of-range timestamps are
+    ignored.
+    
+    Args:
+        df: Frame with 'timestamp' and the column to aggregate
+        column: Column to aggregate
+        how: 'sum' or 'mean'
+        days: Start of each day bin
+        
+    Returns:
+        Float64 array aligned with days; days without samples, or frames
+        without the column, are NaN
+    """
+    if df.empty or column not in df.columns:
+        return np.full(len(days), np.nan)
+    ts = df['timestamp'].to_numpy('datetime64[ns]').view('i8')
+    values = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+    
+    # Day index of every sample; no sort needed since bincount scatters by bin
+    day_idx = (ts - days[0].value) // DAY_NS
+    keep = (ts >= days[0].value) & (day_idx < len(days)) & ~np.isnan(values)
+    day_idx = day_idx[keep]
+    
+    day_sum = np.bincount(day_idx, weights=values[keep], minlength=len(days))
+    day_count = np.bincount(day_idx, minlength=len(days))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        result = day_sum if how == 'sum' else day_sum / day_count
+    return np.where(day_count > 0, result, np.nan)
+
 class HealthDataProvider(ABC):
     """Abstract base class for health data providers.
     
     This class defines the interface that all health data providers must implement.
     It ensures consistent data retrieval and normalization across different sources.
     
-    Each provider should implement methods to retrieve various types of health data
-    and normalize it to match the system's standardized format.
+    Each provider should implement coroutines to retrieve various types of health data
+    and normalize it to match the system's standardized format. Low-cardinality
+    string fields (activity_type, source) should be returned as Categorical.
+    Other columns may be NumPy- or Arrow-backed (pd.ArrowDtype), so consumers
+    should read them with to_numpy(dtype=..., na_value=...).
+    
+    Frames are built directly from parsed API responses and handed over as-is;
+    they should not be round-tripped through JSON (to_json/read_json). When a
+    frame has to cross a process boundary, send it as Arrow IPC or pickle
+    instead, which keep the column dtypes.
+    
+    Original provider payloads are not part of the returned frames, so
+    merges and concats only copy typed columns. Providers that keep them
+    do so in a side table (e.g. HealthDataFetcher.raw_data for Shimmer)
+    that is meant for debugging only; nothing in the pipeline reads it.
     
     Attributes:
         name (str): Provider name for identification
@@ -49,7 +106,7 @@ class HealthDataProvider(ABC):
     """
     
     @abstractmethod
-    def get_sleep_data(self, start_date: datetime, end_date: Optional[datetime] = None) -> pd.DataFrame:
+    async def get_sleep_data(self, start_date: datetime, end_date: Optional[datetime] = None) -> pd.DataFrame:
         """Fetch sleep-related metrics.
         
         Args:
@@ -66,12 +123,11 @@ class HealthDataProvider(ABC):
                 - awake: Time awake in minutes
                 - efficiency: Sleep efficiency percentage
                 - latency: Time to fall asleep in minutes
-                - raw_data: Original provider data
         """
         pass
     
     @abstractmethod
-    def get_activity_data(self, start_date: datetime, end_date: Optional[datetime] = None) -> pd.DataFrame:
+    async def get_activity_data(self, start_date: datetime, end_date: Optional[datetime] = None) -> pd.DataFrame:
         """Fetch activity-related metrics.
         
         Args:
@@ -88,12 +144,11 @@ class HealthDataProvider(ABC):
                 - steps: Step count
                 - heart_rate: Average heart rate
                 - intensity: Activity intensity level
-                - raw_data: Original provider data
         """
         pass
     
     @abstractmethod
-    def get_hrv_data(self, start_date: datetime, end_date: Optional[datetime] = None) -> pd.DataFrame:
+    async def get_hrv_data(self, start_date: datetime, end_date: Optional[datetime] = None) -> pd.DataFrame:
         """Fetch Heart Rate Variability data.
         
         Args:
@@ -107,12 +162,11 @@ class HealthDataProvider(ABC):
                 - sdnn: Standard deviation of NN intervals
                 - lf_hf_ratio: Low-frequency to high-frequency ratio
                 - heart_rate: Associated heart rate
-                - raw_data: Original provider data
         """
         pass
     
     @abstractmethod
-    def get_readiness_data(self, start_date: datetime, end_date: Optional[datetime] = None) -> pd.DataFrame:
+    async def get_readiness_data(self, start_date: datetime, end_date: Optional[datetime] = None) -> pd.DataFrame:
         """Fetch readiness/recovery metrics.
         
         Args:
@@ -127,11 +181,10 @@ class HealthDataProvider(ABC):
                 - strain_score: Accumulated strain (0-100)
                 - sleep_score: Sleep quality contribution
                 - hrv_score: HRV contribution
-                - raw_data: Original provider data
         """
         pass
     
-    def get_nutrition_data(self, start_date: datetime, end_date: Optional[datetime] = None) -> pd.DataFrame:
+    async def get_nutrition_data(self, start_date: datetime, end_date: Optional[datetime] = None) -> pd.DataFrame:
         """Fetch nutrition metrics if supported by provider.
         
         Default implementation returns empty DataFrame. Override if provider
@@ -150,22 +203,53 @@ class HealthDataProvider(ABC):
                 - fat: Fat in grams
                 - fiber: Fiber in grams
                 - water: Water intake in ml
-                - raw_data: Original provider data
         """
         return pd.DataFrame()
     
+    def get_sleep_data_sync(self, start_date: datetime, end_date: Optional[datetime] = None) -> pd.DataFrame:
+        """Blocking wrapper around get_sleep_data for callers without an event loop."""
+        return asyncio.run(self.get_sleep_data(start_date, end_date))
+    
+    def get_activity_data_sync(self, start_date: datetime, end_date: Optional[datetime] = None) -> pd.DataFrame:
+        """Blocking wrapper around get_activity_data for callers without an event loop."""
+        return asyncio.run(self.get_activity_data(start_date, end_date))
+    
+    def get_hrv_data_sync(self, start_date: datetime, end_date: Optional[datetime] = None) -> pd.DataFrame:
+        """Blocking wrapper around get_hrv_data for callers without an event loop."""
+        return asyncio.run(self.get_hrv_data(start_date, end_date))
+    
+    def get_readiness_data_sync(self, start_date: datetime, end_date: Optional[datetime] = None) -> pd.DataFrame:
+        """Blocking wrapper around get_readiness_data for callers without an event loop."""
+        return asyncio.run(self.get_readiness_data(start_date, end_date))
+    
     def normalize_timestamp(self, timestamp: datetime) -> datetime:
         """Convert timestamp to UTC datetime.
         
+        Prefer normalize_timestamps for whole columns.
+        
         Args:
             timestamp: Input timestamp in any format
             
         Returns:
             Normalized UTC datetime
         """
-        if isinstance(timestamp, str):
-            timestamp = pd.to_datetime(timestamp)
-        return pd.Timestamp(timestamp).tz_localize(None)
+        return self.normalize_timestamps([timestamp])[0]
+    
+    @staticmethod
+    def normalize_timestamps(values) -> pd.DatetimeIndex:
+        """Convert a column of timestamps to naive UTC in one call.
+        
+        Args:
+            values: Series, array or list of timestamps in any format
+            
+        Returns:
+            Naive UTC DatetimeIndex; unparseable values become NaT
+        """
+        # 'mixed' parses each element on its own; the default infers one
+        # format from the first element and turns the rest into NaT
+        parsed = pd.to_datetime(values, utc=True, errors='coerce',
+                                format='mixed')
+        return pd.DatetimeIndex(parsed).tz_localize(None)
     
     def normalize_duration(self, duration: float, unit: str = 'minutes') -> float:
         """Convert duration to minutes.
@@ -177,9 +261,4 @@ class HealthDataProvider(ABC):
         Returns:
             Duration in minutes
         """
-        conversions = {
-            'seconds': 1/60,
-            'minutes': 1,
-            'hours': 60
-        }
-        return float(duration) * conversions.get(unit, 1)
+        return float(duration) * _DURATION_TO_MINUTES.get(unit, 1.0)
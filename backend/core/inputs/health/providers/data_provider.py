@@ -1,17 +1,139 @@
-from datetime import datetime
-from typing import Dict, List, Optional
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, Union
+import numpy as np
 import pandas as pd
-from .base import HealthDataProvider
-from .shimmer_client import ShimmerClient, ShimmerEndpoint, ShimmerDataType, HealthDataFetcher
+from .base import HealthDataProvider, aggregate_daily
+from .shimmer_client import (ShimmerClient, ShimmerEndpoint, ShimmerDataType, HealthDataFetcher,
+                             CATEGORICAL_COLUMNS)
+
+# A fetch returns a frame, or a frame with its row-aligned provider payloads
+FetchResult = Union[pd.DataFrame, Tuple[pd.DataFrame, Optional[pd.DataFrame]]]
+
+# Float columns of the frame returned by get_readiness_data, after 'date'
+READINESS_COLUMNS = (
+    'readiness_score', 'sleep_score', 'activity_score', 'hrv_score', 'hr_score',
+    'sleep_duration', 'steps', 'hrv', 'heart_rate'
+)
+
+# Raw daily metrics correlated by analyze_correlations
+CORRELATION_METRICS = ('sleep_duration', 'steps', 'hrv', 'heart_rate')
 
 class ShimmerHealthProvider(HealthDataProvider):
     """Health data provider using Open mHealth Shimmer for data normalization."""
     
-    def __init__(self, shimmer_base_url: str, credentials: Dict[ShimmerEndpoint, str]):
+    def __init__(self, shimmer_base_url: str, credentials: Dict[ShimmerEndpoint, str],
+                 cache_ttl: float = 60.0, fetch_window: timedelta = timedelta(days=30),
+                 fetch_concurrency: int = 4):
+        """Initialize the provider.
+        
+        Args:
+            shimmer_base_url: Shimmer API base URL
+            credentials: Mapping of endpoints to credentials
+            cache_ttl: Seconds a fetched closed-window frame is reused for
+            fetch_window: Longest date range requested from Shimmer at once
+            fetch_concurrency: Maximum window requests in flight per fetch
+        """
         self.fetcher = HealthDataFetcher(
             ShimmerClient(shimmer_base_url, credentials)
         )
         self.endpoints = list(credentials.keys())
+        
+        # Overlapping dashboard views share fetches of the same window
+        self.cache_ttl = cache_ttl
+        self._cache: Dict[tuple, Tuple[float, pd.DataFrame]] = {}
+        
+        # Long ranges are split so no single response has to hold them all
+        self.fetch_window = fetch_window
+        self.fetch_concurrency = fetch_concurrency
+    
+    async def _cached(self, data_type: ShimmerDataType, start_date: datetime,
+                      end_date: Optional[datetime],
+                      fetch: Callable[[], Awaitable[pd.DataFrame]]) -> pd.DataFrame:
+        """Return a recent frame for this window, or fetch and remember it.
+        
+        Only closed windows (an explicit end_date in the past) are cached,
+        so data for today is never served stale. Cached frames are shared
+        between callers and must not be mutated.
+        """
+        if end_date is None or end_date >= datetime.now():
+            return await fetch()
+        
+        key = (data_type, start_date, end_date)
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        if entry is not None and now - entry[0] < self.cache_ttl:
+            return entry[1]
+        
+        df = await fetch()
+        now = time.monotonic()
+        self._cache = {
+            k: v for k, v in self._cache.items() if now - v[0] < self.cache_ttl
+        }
+        self._cache[key] = (now, df)
+        return df
+    
+    async def _fetch_frame(self, fetch_fn: Callable[..., Awaitable[FetchResult]],
+                           **kwargs) -> Tuple[pd.DataFrame, Optional[pd.DataFrame]]:
+        """Await a Shimmer fetch and normalize its timestamps.
+        
+        Returns:
+            The frame and, when fetch_fn returns (frame, payloads) like
+            HealthDataFetcher.fetch_with_raw, its row-aligned payloads
+        """
+        result = await fetch_fn(**kwargs)
+        df, raw = result if isinstance(result, tuple) else (result, None)
+        if 'timestamp' in df.columns:
+            df['timestamp'] = self.normalize_timestamps(df['timestamp'])
+        return df, raw
+    
+    async def _fetch_windowed(self, fetch_fn: Callable[..., Awaitable[FetchResult]], start_date: datetime,
+                              end_date: Optional[datetime] = None, **kwargs) -> pd.DataFrame:
+        """Fetch a date range as fetch_window-sized requests.
+        
+        At most fetch_concurrency windows are in flight, so parsing of
+        landed windows overlaps with the requests still pending. Payloads
+        returned by fetch_fn are concatenated in window order and stored
+        in fetcher.raw_data[data_type], row-aligned with the frame.
+        """
+        end = end_date or datetime.now()
+        if end - start_date <= self.fetch_window:
+            df, raw = await self._fetch_frame(fetch_fn, start_date=start_date,
+                                              end_date=end_date, **kwargs)
+            if raw is not None:
+                self.fetcher.raw_data[kwargs['data_type']] = raw
+            return df
+        
+        semaphore = asyncio.Semaphore(self.fetch_concurrency)
+        
+        async def fetch_window(window_start: datetime,
+                               window_end: datetime) -> Tuple[pd.DataFrame, Optional[pd.DataFrame]]:
+            async with semaphore:
+                return await self._fetch_frame(fetch_fn, start_date=window_start,
+                                               end_date=window_end, **kwargs)
+        
+        windows = []
+        window_start = start_date
+        while window_start < end:
+            window_end = min(window_start + self.fetch_window, end)
+            windows.append(fetch_window(window_start, window_end))
+            window_start = window_end
+        
+        # gather keeps window order, so frames and payloads stay row-aligned
+        results = [(df, raw) for df, raw in await asyncio.gather(*windows) if not df.empty]
+        if not results:
+            return pd.DataFrame()
+        
+        raws = [raw for _, raw in results if raw is not None]
+        if raws:
+            self.fetcher.raw_data[kwargs['data_type']] = pd.concat(raws, ignore_index=True)
+        
+        df = pd.concat([df for df, _ in results], ignore_index=True)
+        for column in CATEGORICAL_COLUMNS:
+            if column in df.columns:
+                df[column] = df[column].astype('category')
+        return df
     
     async def get_sleep_data(self, start_date: datetime, end_date: Optional[datetime] = None) -> pd.DataFrame:
         """Retrieve sleep metrics from the data source.
@@ -31,10 +153,15 @@ class ShimmerHealthProvider(HealthDataProvider):
                 - efficiency: Sleep efficiency (%)
                 - source: Data source
         """
-        return self.fetcher.get_sleep_data(
-            endpoints=self.endpoints,
-            start_date=start_date,
-            end_date=end_date
+        return await self._cached(
+            ShimmerDataType.SLEEP_EPISODE, start_date, end_date,
+            lambda: self._fetch_windowed(
+                self.fetcher.fetch_with_raw,
+                data_type=ShimmerDataType.SLEEP_EPISODE,
+                endpoints=self.endpoints,
+                start_date=start_date,
+                end_date=end_date
+            )
         )
     
     async def get_activity_data(self, start_date: datetime, end_date: Optional[datetime] = None) -> pd.DataFrame:
@@ -56,26 +183,37 @@ class ShimmerHealthProvider(HealthDataProvider):
                 - source: Data source
         """
         # Get both physical activity and step count data
-        activity_df = self.fetcher.get_activity_data(
-            endpoints=self.endpoints,
-            start_date=start_date,
-            end_date=end_date
-        )
-        
-        steps_df = self.fetcher.client.get_data(
-            endpoint=self.endpoints[0],  # Use primary source for steps
-            data_type=ShimmerDataType.STEP_COUNT,
-            start_date=start_date,
-            end_date=end_date
+        activity_df, steps_df = await asyncio.gather(
+            self._cached(
+                ShimmerDataType.PHYSICAL_ACTIVITY, start_date, end_date,
+                lambda: self._fetch_windowed(
+                    self.fetcher.fetch_with_raw,
+                    data_type=ShimmerDataType.PHYSICAL_ACTIVITY,
+                    endpoints=self.endpoints,
+                    start_date=start_date,
+                    end_date=end_date
+                )
+            ),
+            self._cached(
+                ShimmerDataType.STEP_COUNT, start_date, end_date,
+                lambda: self._fetch_windowed(
+                    self.fetcher.get_endpoint_data,
+                    endpoint=self.endpoints[0],  # Use primary source for steps
+                    data_type=ShimmerDataType.STEP_COUNT,
+                    start_date=start_date,
+                    end_date=end_date
+                )
+            )
         )
         
-        # Merge activity and steps data
+        # Merge activity and steps data on sorted timestamp indexes
         if not activity_df.empty and not steps_df.empty:
-            activity_df = activity_df.merge(
-                steps_df[['timestamp', 'steps']],
-                on='timestamp',
-                how='outer'
-            )
+            activity_df = activity_df.set_index('timestamp').sort_index().join(
+                steps_df.set_index('timestamp')[['steps']].sort_index(),
+                how='outer',
+                lsuffix='_x',
+                rsuffix='_y'
+            ).reset_index()
         
         return activity_df
     
@@ -95,10 +233,15 @@ class ShimmerHealthProvider(HealthDataProvider):
                 - heart_rate: Associated heart rate
                 - source: Data source
         """
-        return self.fetcher.get_hrv_data(
-            endpoints=self.endpoints,
-            start_date=start_date,
-            end_date=end_date
+        return await self._cached(
+            ShimmerDataType.HRV, start_date, end_date,
+            lambda: self._fetch_windowed(
+                self.fetcher.fetch_with_raw,
+                data_type=ShimmerDataType.HRV,
+                endpoints=self.endpoints,
+                start_date=start_date,
+                end_date=end_date
+            )
         )
     
     async def get_readiness_data(self, start_date: datetime, end_date: Optional[datetime] = None) -> pd.DataFrame:
@@ -126,123 +269,80 @@ class ShimmerHealthProvider(HealthDataProvider):
                 - hrv_score: HRV contribution
                 - source: Data source
         """
-        # Fetch all required metrics
-        sleep_df = await self.get_sleep_data(start_date, end_date)
-        activity_df = await self.get_activity_data(start_date, end_date)
-        hrv_df = await self.get_hrv_data(start_date, end_date)
-        
-        # Get heart rate data
-        hr_df = self.fetcher.client.get_data(
-            endpoint=self.endpoints[0],  # Use primary source for heart rate
-            data_type=ShimmerDataType.HEART_RATE,
-            start_date=start_date,
-            end_date=end_date
+        # Fetch all required metrics concurrently
+        sleep_df, activity_df, hrv_df, hr_df = await asyncio.gather(
+            self.get_sleep_data(start_date, end_date),
+            self.get_activity_data(start_date, end_date),
+            self.get_hrv_data(start_date, end_date),
+            self._cached(
+                ShimmerDataType.HEART_RATE, start_date, end_date,
+                lambda: self._fetch_windowed(
+                    self.fetcher.get_endpoint_data,
+                    endpoint=self.endpoints[0],  # Use primary source for heart rate
+                    data_type=ShimmerDataType.HEART_RATE,
+                    start_date=start_date,
+                    end_date=end_date
+                )
+            )
         )
         
-        readiness_data = []
-        for date in pd.date_range(start_date, end_date or datetime.now(), freq='D'):
-            next_date = date + pd.Timedelta(days=1)
-            
-            # Calculate daily metrics
-            day_sleep = sleep_df[
-                (sleep_df['timestamp'] >= date) & 
-                (sleep_df['timestamp'] < next_date)
-            ]['duration'].sum() if 'duration' in sleep_df.columns else 0
-            
-            day_activity = activity_df[
-                (activity_df['timestamp'] >= date) & 
-                (activity_df['timestamp'] < next_date)
-            ]
-            
-            day_hrv = hrv_df[
-                (hrv_df['timestamp'] >= date) & 
-                (hrv_df['timestamp'] < next_date)
-            ]['hrv'].mean() if 'hrv' in hrv_df.columns else None
-            
-            day_hr = hr_df[
-                (hr_df['timestamp'] >= date) & 
-                (hr_df['timestamp'] < next_date)
-            ]['heart_rate'].mean() if 'heart_rate' in hr_df.columns else None
-            
-            # Calculate component scores
-            sleep_score = min(100, (day_sleep / 8) * 100)  # Optimal sleep = 8 hours
-            
-            activity_score = min(100, day_activity['steps'].sum() / 10000 * 100) \
-                if not day_activity.empty and 'steps' in day_activity.columns else 0
-            
-            hrv_score = min(100, (day_hrv / 100) * 100) if day_hrv is not None else 50
-            hr_score = 100 - abs(day_hr - 70) if day_hr is not None else 50
-            
-            # Calculate weighted readiness score
-            readiness_score = (
-                sleep_score * 0.4 +
-                activity_score * 0.3 +
-                hrv_score * 0.2 +
-                hr_score * 0.1
-            )
-            
-            readiness_data.append({
-                'date': date,
-                'readiness_score': readiness_score,
-                'sleep_score': sleep_score,
-                'activity_score': activity_score,
-                'hrv_score': hrv_score,
-                'hr_score': hr_score,
-                'sleep_duration': day_sleep,
-                'steps': day_activity['steps'].sum() if not day_activity.empty and 'steps' in day_activity.columns else 0,
-                'hrv': day_hrv,
-                'heart_rate': day_hr
-            })
-        
-        return pd.DataFrame(readiness_data)
+        days = pd.date_range(start_date, end_date or datetime.now(), freq='D')
+        if days.empty:
+            return pd.DataFrame()
+        
+        # Preallocate the output as one float64 block and write into its columns
+        values = np.empty((len(days), len(READINESS_COLUMNS)), order='F')
+        (readiness_score, sleep_score, activity_score, hrv_score, hr_score,
+         sleep_arr, steps_arr, hrv_arr, hr_arr) = values.T
+        
+        # One pass per frame instead of masking every frame once per day
+        sleep_arr[:] = np.nan_to_num(aggregate_daily(sleep_df, 'duration', 'sum', days))
+        steps_arr[:] = np.nan_to_num(aggregate_daily(activity_df, 'steps', 'sum', days))
+        hrv_arr[:] = aggregate_daily(hrv_df, 'hrv', 'mean', days)
+        hr_arr[:] = aggregate_daily(hr_df, 'heart_rate', 'mean', days)
+        
+        # Calculate component scores over all days at once
+        np.minimum(100.0, sleep_arr / 8.0 * 100.0, out=sleep_score)  # Optimal sleep = 8 hours
+        np.minimum(100.0, steps_arr / 10000.0 * 100.0, out=activity_score)
+        hrv_score[:] = np.where(np.isnan(hrv_arr), 50.0, np.minimum(100.0, hrv_arr))
+        hr_score[:] = np.where(np.isnan(hr_arr), 50.0, 100.0 - np.abs(hr_arr - 70.0))
+        
+        # Calculate weighted readiness score
+        readiness_score[:] = (
+            sleep_score * 0.4 +
+            activity_score * 0.3 +
+            hrv_score * 0.2 +
+            hr_score * 0.1
+        )
+        
+        readiness_df = pd.DataFrame(values, columns=list(READINESS_COLUMNS), copy=False)
+        readiness_df.insert(0, 'date', days)
+        return readiness_df
     
-    async def get_nutrition_data(self, start_date: datetime, end_date: Optional[datetime] = None) -> pd.DataFrame:
-        """Retrieve nutrition data from the data source.
+    async def analyze_correlations(self, start_date: datetime,
+                                   end_date: Optional[datetime] = None) -> pd.DataFrame:
+        """Correlate the daily health metrics over a date range.
+        
+        Days missing a metric are filled with that metric's mean so every
+        day contributes to every pair.
         
         Args:
             start_date: Start of date range
             end_date: Optional end of date range
             
         Returns:
-            DataFrame with normalized nutrition metrics:
-                - timestamp: Time of measurement
-                - calories: Total calories
-                - protein: Protein (g)
-                - carbs: Carbohydrates (g)
-                - fat: Fat (g)
-                - fiber: Fiber (g)
-                - water: Water intake (ml)
-                - source: Data source
-        """
-        # TO DO: Implement nutrition data retrieval
-        pass
-    
-    def normalize_timestamp(self, timestamp: datetime) -> datetime:
-        """Convert timestamp to UTC datetime.
-        
-        Args:
-            timestamp: Input timestamp in any format
-            
-        Returns:
-            Normalized UTC datetime
+            Pearson correlation matrix indexed by CORRELATION_METRICS
         """
-        if isinstance(timestamp, str):
-            timestamp = pd.to_datetime(timestamp)
-        return pd.Timestamp(timestamp).tz_localize(None)
-    
-    def normalize_duration(self, duration: float, unit: str = 'minutes') -> float:
-        """Convert duration to minutes.
+        readiness_df = await self.get_readiness_data(start_date, end_date)
+        metrics = list(CORRELATION_METRICS)
+        if readiness_df.empty:
+            return pd.DataFrame(np.nan, index=metrics, columns=metrics)
         
-        Args:
-            duration: Duration value
-            unit: Input unit ('seconds', 'minutes', 'hours')
-            
-        Returns:
-            Duration in minutes
-        """
-        conversions = {
-            'seconds': 1/60,
-            'minutes': 1,
-            'hours': 60
-        }
-        return float(duration) * conversions.get(unit, 1)
+        # One (days x metrics) float64 matrix, mean-imputed, into one corrcoef
+        matrix = readiness_df[metrics].to_numpy(dtype=np.float64)
+        missing = np.isnan(matrix)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = np.nansum(matrix, axis=0) / (~missing).sum(axis=0)
+            matrix = np.where(missing, means, matrix)
+            corr = np.corrcoef(matrix, rowvar=False)
+        return pd.DataFrame(corr, index=metrics, columns=metrics)
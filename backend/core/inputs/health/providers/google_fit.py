@@ -65,17 +65,33 @@ Example:
     ... )
 """
 
+import asyncio
 import os
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Union
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+from typing import ClassVar, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+import google_auth_httplib2
+import httplib2
+import numpy as np
+import orjson
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+from googleapiclient.model import JsonModel
 
 from .base import HealthDataProvider
 
+try:
+    # Optional: Arrow-backed frames group and aggregate on Arrow kernels
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
 SCOPES = [
     'https://www.googleapis.com/auth/fitness.activity.read',
     'https://www.googleapis.com/auth/fitness.body.read',
@@ -83,24 +99,181 @@ SCOPES = [
     'https://www.googleapis.com/auth/fitness.sleep.read'
 ]
 
+# Google Fit sleep stage codes: awake, sleep, out-of-bed, light, deep, REM
+SLEEP_STAGES = pd.CategoricalDtype(categories=[1, 2, 3, 4, 5, 6])
+
+# Data types requested by each getter; get_readiness_data asks for all at once
+SLEEP_DATA_TYPES = ("com.google.sleep.segment",)
+ACTIVITY_DATA_TYPES = (
+    "com.google.step_count.delta",
+    "com.google.calories.expended",
+    "com.google.distance.delta",
+    "com.google.heart_rate.bpm"
+)
+HEART_RATE_DATA_TYPES = ("com.google.heart_rate.bpm",)
+
+# Activity frame 'type' column: small integer codes labelled by data type
+ACTIVITY_TYPES = pd.CategoricalDtype(categories=ACTIVITY_DATA_TYPES)
+READINESS_DATA_TYPES = SLEEP_DATA_TYPES + ACTIVITY_DATA_TYPES
+
+DAY_MILLIS = 86400000
+
+# Seconds before a Google Fit request is abandoned
+HTTP_TIMEOUT = 30
+
+class _OrjsonModel(JsonModel):
+    """JsonModel that decodes responses with orjson instead of stdlib json."""
+    
+    def deserialize(self, content):
+        body = orjson.loads(content)
+        if self._data_wrapper and 'data' in body:
+            body = body['data']
+        return body
+
+def _point_counts(datasets: List[dict]) -> np.ndarray:
+    """Number of points in each dataset."""
+    return np.fromiter((len(ds.get('point', ())) for ds in datasets),
+                       dtype=np.int64, count=len(datasets))
+
+@lru_cache(maxsize=16)
+def _aggregate_by(data_types: Tuple[str, ...]) -> Tuple[dict, ...]:
+    """aggregateBy entries for a set of data types, built once per set.
+    
+    The entries are shared between request bodies and must not be mutated.
+    """
+    return tuple({"dataTypeName": data_type} for data_type in data_types)
+
+def _columns_to_frame(columns: Dict[str, object]) -> pd.DataFrame:
+    """Build a frame from column arrays, Arrow-backed when pyarrow is available.
+    
+    Categorical columns stay pandas categoricals.
+    """
+    if pa is None:
+        return pd.DataFrame(columns, copy=False)
+    categoricals = {name: values for name, values in columns.items()
+                    if isinstance(values, pd.Categorical)}
+    arrays = {}
+    for name, values in columns.items():
+        if name in categoricals:
+            continue
+        values = np.asarray(values)
+        # Object columns hold strings; say so, or an empty one becomes null-typed
+        arrays[name] = pa.array(values, type=pa.string() if values.dtype == object else None)
+    df = pa.table(arrays).to_pandas(types_mapper=pd.ArrowDtype)
+    for name, values in categoricals.items():
+        df[name] = values
+    return df[list(columns)]
+
+def _no_datasets(data_types: Sequence[str]) -> Dict[str, List[dict]]:
+    """Empty _aggregate result, for windows that need no request."""
+    return {data_type: [] for data_type in data_types}
+
+def _points(datasets: List[dict]) -> Iterator[dict]:
+    """Every point of every dataset, in order, as one flat iterator."""
+    return chain.from_iterable(ds.get('point', ()) for ds in datasets)
+
+def _point_nanos(datasets: List[dict], key: str, count: int) -> np.ndarray:
+    """Read a point's start/end nanos field straight into an int64 array."""
+    return np.fromiter(map(int, map(itemgetter(key), _points(datasets))),
+                       dtype=np.int64, count=count)
+
+def _point_values(datasets: List[dict], value_key: str, dtype, count: int) -> np.ndarray:
+    """Read each point's first value (e.g. its 'fpVal') into an array."""
+    values = map(itemgetter(0), map(itemgetter('value'), _points(datasets)))
+    return np.fromiter(map(itemgetter(value_key), values), dtype=dtype, count=count)
+
+def _estimate_hrv(heart_rate: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Rolling RMSSD and SDNN (ms) from heart rate samples.
+    
+    RR intervals are approximated as 60000 / bpm. Each value covers the
+    window samples ending at that row; rows before the first full window
+    are NaN.
+    """
+    rmssd = np.full(len(heart_rate), np.nan)
+    sdnn = np.full(len(heart_rate), np.nan)
+    if len(heart_rate) < window:
+        return rmssd, sdnn
+    
+    with np.errstate(divide='ignore'):
+        rr = np.where(heart_rate > 0, 60000.0 / heart_rate, np.nan)
+    
+    # Reduce over strided views so no (samples x window) copy is made
+    rmssd[window - 1:] = np.sqrt(sliding_window_view(np.diff(rr) ** 2, window - 1).mean(axis=1))
+    mean = sliding_window_view(rr, window).mean(axis=1)
+    mean_sq = sliding_window_view(rr ** 2, window).mean(axis=1)
+    sdnn[window - 1:] = np.sqrt(np.maximum(mean_sq - mean ** 2, 0))
+    return rmssd, sdnn
+
+def _naive_utc(value: datetime) -> pd.Timestamp:
+    """Express a datetime as naive UTC; naive inputs are taken to be UTC.
+    
+    Parsed timestamps, day buckets and request windows all use this one
+    convention so readiness days line up with the data they summarize.
+    """
+    ts = pd.Timestamp(value)
+    return ts.tz_localize(None) if ts.tzinfo is None else ts.tz_convert('UTC').tz_localize(None)
+
+def _utc_now() -> datetime:
+    """Current time as a naive UTC datetime."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+def _daily(df: pd.DataFrame, key: str, column: str, how: str,
+           days: pd.DatetimeIndex) -> pd.Series:
+    """Aggregate a column per calendar day, aligned to midnight-stamped days."""
+    if df.empty or key not in df.columns:
+        return pd.Series(np.nan, index=days)
+    # Group on the normalized key rather than pd.Grouper(freq='D'), which
+    # sorts by time and would change which row 'first' picks
+    return df.groupby(df[key].dt.normalize())[column].agg(how).reindex(days)
+
 class GoogleFitAdapter(HealthDataProvider):
     """Adapter for Google Fit API."""
     
-    def __init__(self, credentials_path: str = None):
+    # Credentials shared by every adapter in the process, keyed by scopes,
+    # so token.json is parsed at most once
+    _CREDS_CACHE: ClassVar[Dict[Tuple[str, ...], Credentials]] = {}
+    
+    def __init__(self, credentials_path: str = None, cache_ttl: float = 300.0,
+                 hrv_window: int = 30):
         self.credentials_path = credentials_path or os.getenv('GOOGLE_FIT_CREDENTIALS')
         self.creds = None
-        self.service = None
-        self.initialize_service()
+        self._service = None
+        self._service_lock = threading.Lock()
+        self._local = threading.local()
+        
+        # Repeat queries for the same window reuse the parsed response
+        self.cache_ttl = cache_ttl
+        self._cache: Dict[tuple, Tuple[float, Dict[str, List[dict]]]] = {}
+        
+        # Heart rate samples per rolling RMSSD/SDNN estimate
+        self.hrv_window = max(2, hrv_window)
+    
+    @property
+    def service(self):
+        """Fitness API client, built on first use.
+        
+        First use may come from concurrent worker threads, so only one of
+        them runs the OAuth flow.
+        """
+        if self._service is None:
+            with self._service_lock:
+                if self._service is None:
+                    self.initialize_service()
+        return self._service
     
     def initialize_service(self):
         """Initialize Google Fit API service."""
-        if os.path.exists('token.json'):
+        scopes = tuple(SCOPES)
+        if self.creds is None:
+            self.creds = self._CREDS_CACHE.get(scopes)
+        if self.creds is None and os.path.exists('token.json'):
             self.creds = Credentials.from_authorized_user_file('token.json', SCOPES)
         
         if not self.creds or not self.creds.valid:
             if self.creds and self.creds.expired and self.creds.refresh_token:
                 self.creds.refresh(Request())
             else:
+                from google_auth_oauthlib.flow import InstalledAppFlow
                 flow = InstalledAppFlow.from_client_secrets_file(
                     self.credentials_path, SCOPES)
                 self.creds = flow.run_local_server(port=0)
@@ -108,11 +281,145 @@ class GoogleFitAdapter(HealthDataProvider):
             with open('token.json', 'w') as token:
                 token.write(self.creds.to_json())
         
-        self.service = build('fitness', 'v1', credentials=self.creds)
+        self._CREDS_CACHE[scopes] = self.creds
+        
+        # Imported lazily: discovery is the heavy part of googleapiclient and
+        # is only needed when the service is first built
+        from googleapiclient.discovery import build
+        
+        # Use the discovery document bundled with googleapiclient rather
+        # than fetching it over the network
+        self._service = build('fitness', 'v1', credentials=self.creds,
+                              model=_OrjsonModel(),
+                              static_discovery=True, cache_discovery=False)
+    
+    def _http(self) -> google_auth_httplib2.AuthorizedHttp:
+        """Authorized transport for the calling thread.
+        
+        httplib2.Http is not thread-safe, so each to_thread worker keeps its
+        own keep-alive connection rather than sharing the service's default
+        one or opening a new TLS session per request.
+        """
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(
+                self.creds, http=httplib2.Http(timeout=HTTP_TIMEOUT))
+            self._local.http = http
+        return http
+    
+    def _nanoseconds_to_datetime(self, nanos: Sequence[Union[int, str]]) -> pd.DatetimeIndex:
+        """Convert nanosecond epoch values to naive UTC timestamps in bulk.
+        
+        Google Fit sends nanos as decimal strings; they are parsed straight
+        into an int64 array so the conversion is a single vectorized cast.
+        """
+        return pd.to_datetime(np.asarray(nanos, dtype=np.int64), unit='ns')
+    
+    def _do_aggregate(self, body: dict) -> dict:
+        """Execute one aggregate request; blocking, so run it off the event loop."""
+        return self.service.users().dataset().aggregate(
+            userId="me",
+            body=body
+        ).execute(http=self._http())
+    
+    async def _aggregate(self, data_types: Sequence[str], start_date: datetime,
+                         end_date: datetime,
+                         bucket_millis: Optional[int] = None) -> Dict[str, List[dict]]:
+        """Request several data types in one aggregate call.
+        
+        With bucket_millis set, Google Fit pre-aggregates each data type
+        into one point per bucket (summed steps, mean heart rate, ...)
+        instead of returning raw samples.
+        
+        Only the HTTP request itself runs on a worker thread, so cache hits
+        and empty windows never leave the event loop. Responses are reused
+        for cache_ttl seconds per (data types, window) and are shared
+        between callers, so they must not be mutated.
+        
+        Naive start and end dates are taken to be UTC, matching the naive
+        UTC timestamps the parsers return.
+        
+        Returns:
+            Datasets from every bucket, keyed by data type
+        """
+        start_ms = _naive_utc(start_date).value // 1_000_000
+        end_ms = min(_naive_utc(end_date), _naive_utc(_utc_now())).value // 1_000_000
+        if end_ms <= start_ms:
+            # Nothing to fetch; parsers turn this into empty typed frames
+            return _no_datasets(data_types)
+        
+        key = (tuple(sorted(data_types)), start_ms, end_ms, bucket_millis)
+        entry = self._cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.cache_ttl:
+            return entry[1]
+        
+        body = {
+            "aggregateBy": _aggregate_by(tuple(data_types)),
+            "startTimeMillis": start_ms,
+            "endTimeMillis": end_ms
+        }
+        if bucket_millis:
+            body["bucketByTime"] = {"durationMillis": bucket_millis}
+        
+        response = await asyncio.to_thread(self._do_aggregate, body)
+        
+        # Each bucket holds one dataset per aggregateBy entry, in request order
+        datasets = {data_type: [] for data_type in data_types}
+        for bucket in response.get('bucket', []):
+            for data_type, dataset in zip(data_types, bucket.get('dataset', [])):
+                datasets[data_type].append(dataset)
+        
+        now = time.monotonic()
+        self._cache = {
+            k: v for k, v in self._cache.items() if now - v[0] < self.cache_ttl
+        }
+        self._cache[key] = (now, datasets)
+        return datasets
+    
+    def _parse_sleep(self, datasets: Dict[str, List[dict]]) -> pd.DataFrame:
+        """Build the sleep segment frame from aggregated datasets."""
+        datasets = datasets["com.google.sleep.segment"]
+        n = int(_point_counts(datasets).sum())
+        start_time = self._nanoseconds_to_datetime(
+            _point_nanos(datasets, 'startTimeNanos', n))
+        end_time = self._nanoseconds_to_datetime(
+            _point_nanos(datasets, 'endTimeNanos', n))
+        sleep_types = _point_values(datasets, 'intVal', np.int64, n)
+        return _columns_to_frame({
+            'start_time': start_time,
+            'end_time': end_time,
+            'duration': (end_time - start_time).total_seconds() / 60,
+            'sleep_type': pd.Categorical(sleep_types, dtype=SLEEP_STAGES)
+        })
     
-    def _nanoseconds_to_datetime(self, nanos: int) -> datetime:
-        """Convert nanoseconds since epoch to datetime."""
-        return datetime.fromtimestamp(nanos // 1000000000)
+    def _parse_activity(self, datasets: Dict[str, List[dict]]) -> pd.DataFrame:
+        """Build the activity frame from aggregated datasets."""
+        by_type = [datasets[data_type] for data_type in ACTIVITY_DATA_TYPES]
+        datasets = list(chain.from_iterable(by_type))
+        counts = _point_counts(datasets)
+        n = int(counts.sum())
+        
+        # Code each dataset by its position in ACTIVITY_DATA_TYPES; the
+        # aggregated dataSourceIds ("derived:...") never need parsing
+        dataset_codes = np.repeat(np.arange(len(by_type), dtype=np.int8),
+                                  [len(type_datasets) for type_datasets in by_type])
+        return _columns_to_frame({
+            'timestamp': self._nanoseconds_to_datetime(
+                _point_nanos(datasets, 'startTimeNanos', n)),
+            'value': _point_values(datasets, 'fpVal', np.float64, n),
+            'type': pd.Categorical.from_codes(np.repeat(dataset_codes, counts),
+                                              dtype=ACTIVITY_TYPES)
+        })
+    
+    def _parse_heart_rate(self, datasets: Dict[str, List[dict]]) -> pd.DataFrame:
+        """Build the heart rate frame from aggregated datasets."""
+        datasets = datasets["com.google.heart_rate.bpm"]
+        n = int(_point_counts(datasets).sum())
+        return _columns_to_frame({
+            'timestamp': self._nanoseconds_to_datetime(
+                _point_nanos(datasets, 'startTimeNanos', n)),
+            'heart_rate': _point_values(datasets, 'fpVal', np.float64, n)
+        })
     
     async def get_sleep_data(self, start_date: datetime,
                           end_date: Optional[datetime] = None) -> pd.DataFrame:
@@ -137,40 +444,9 @@ class GoogleFitAdapter(HealthDataProvider):
             RuntimeError: If API request fails
             PermissionError: If sleep scope is not authorized
         """
-        if not self.service:
-            self.initialize_service()
-            
-        end_date = end_date or datetime.now()
-        
-        body = {
-            "aggregateBy": [{
-                "dataTypeName": "com.google.sleep.segment"
-            }],
-            "startTimeMillis": int(start_date.timestamp() * 1000),
-            "endTimeMillis": int(end_date.timestamp() * 1000)
-        }
-        
-        response = self.service.users().dataset().aggregate(
-            userId="me",
-            body=body
-        ).execute()
-        
-        sleep_data = []
-        for bucket in response.get('bucket', []):
-            for dataset in bucket.get('dataset', []):
-                for point in dataset.get('point', []):
-                    start_time = self._nanoseconds_to_datetime(int(point['startTimeNanos']))
-                    end_time = self._nanoseconds_to_datetime(int(point['endTimeNanos']))
-                    sleep_type = point['value'][0]['intVal']
-                    
-                    sleep_data.append({
-                        'start_time': start_time,
-                        'end_time': end_time,
-                        'duration': (end_time - start_time).total_seconds() / 60,
-                        'sleep_type': sleep_type
-                    })
-        
-        return pd.DataFrame(sleep_data)
+        end_date = end_date or _utc_now()
+        datasets = await self._aggregate(SLEEP_DATA_TYPES, start_date, end_date)
+        return self._parse_sleep(datasets)
     
     async def get_activity_data(self, start_date: datetime,
                              end_date: Optional[datetime] = None) -> pd.DataFrame:
@@ -195,42 +471,9 @@ class GoogleFitAdapter(HealthDataProvider):
             RuntimeError: If API request fails
             PermissionError: If activity scope is not authorized
         """
-        if not self.service:
-            self.initialize_service()
-            
-        end_date = end_date or datetime.now()
-        
-        body = {
-            "aggregateBy": [
-                {"dataTypeName": "com.google.step_count.delta"},
-                {"dataTypeName": "com.google.calories.expended"},
-                {"dataTypeName": "com.google.distance.delta"},
-                {"dataTypeName": "com.google.heart_rate.bpm"}
-            ],
-            "startTimeMillis": int(start_date.timestamp() * 1000),
-            "endTimeMillis": int(end_date.timestamp() * 1000)
-        }
-        
-        response = self.service.users().dataset().aggregate(
-            userId="me",
-            body=body
-        ).execute()
-        
-        activity_data = []
-        for bucket in response.get('bucket', []):
-            for dataset in bucket.get('dataset', []):
-                for point in dataset.get('point', []):
-                    timestamp = self._nanoseconds_to_datetime(int(point['startTimeNanos']))
-                    value = point['value'][0]['fpVal']
-                    data_type = dataset['dataSourceId']
-                    
-                    activity_data.append({
-                        'timestamp': timestamp,
-                        'value': value,
-                        'type': data_type
-                    })
-        
-        return pd.DataFrame(activity_data)
+        end_date = end_date or _utc_now()
+        datasets = await self._aggregate(ACTIVITY_DATA_TYPES, start_date, end_date)
+        return self._parse_activity(datasets)
     
     async def get_hrv_data(self, start_date: datetime,
                         end_date: Optional[datetime] = None) -> pd.DataFrame:
@@ -255,38 +498,14 @@ class GoogleFitAdapter(HealthDataProvider):
             RuntimeError: If API request fails
             PermissionError: If heart rate scope is not authorized
         """
-        if not self.service:
-            self.initialize_service()
-            
-        end_date = end_date or datetime.now()
+        end_date = end_date or _utc_now()
         
         # Get detailed heart rate data for HRV calculation
-        body = {
-            "aggregateBy": [{
-                "dataTypeName": "com.google.heart_rate.bpm"
-            }],
-            "startTimeMillis": int(start_date.timestamp() * 1000),
-            "endTimeMillis": int(end_date.timestamp() * 1000)
-        }
-        
-        response = self.service.users().dataset().aggregate(
-            userId="me",
-            body=body
-        ).execute()
-        
-        hrv_data = []
-        for bucket in response.get('bucket', []):
-            for dataset in bucket.get('dataset', []):
-                for point in dataset.get('point', []):
-                    timestamp = self._nanoseconds_to_datetime(int(point['startTimeNanos']))
-                    value = point['value'][0]['fpVal']
-                    
-                    hrv_data.append({
-                        'timestamp': timestamp,
-                        'heart_rate': value
-                    })
-        
-        return pd.DataFrame(hrv_data)
+        datasets = await self._aggregate(HEART_RATE_DATA_TYPES, start_date, end_date)
+        hrv_df = self._parse_heart_rate(datasets)
+        hrv_df['rmssd'], hrv_df['sdnn'] = _estimate_hrv(
+            hrv_df['heart_rate'].to_numpy(dtype=float, na_value=np.nan), self.hrv_window)
+        return hrv_df
     
     async def get_readiness_data(self, start_date: datetime,
                               end_date: Optional[datetime] = None) -> pd.DataFrame:
@@ -317,33 +536,42 @@ class GoogleFitAdapter(HealthDataProvider):
             RuntimeError: If API request fails
             PermissionError: If required scopes are not authorized
         """
-        if not self.service:
-            self.initialize_service()
-            
-        # Gather required metrics
-        sleep_df = await self.get_sleep_data(start_date, end_date)
-        activity_df = await self.get_activity_data(start_date, end_date)
-        hrv_df = await self.get_hrv_data(start_date, end_date)
-        
-        readiness_data = []
-        for date in pd.date_range(start_date, end_date or datetime.now(), freq='D'):
-            day_sleep = sleep_df[sleep_df['start_time'].dt.date == date.date()]['duration'].sum()
-            day_activity = activity_df[activity_df['timestamp'].dt.date == date.date()]
-            day_hr = hrv_df[hrv_df['timestamp'].dt.date == date.date()]['heart_rate'].mean()
-            
-            # Basic readiness score calculation
-            sleep_score = min(100, (day_sleep / 8) * 100)  # Optimal sleep = 8 hours
-            activity_score = min(100, day_activity['value'].iloc[0] / 30 * 100) if not day_activity.empty else 0
-            hr_score = 100 - abs(day_hr - 70) if not pd.isna(day_hr) else 50  # Assuming 70 bpm is optimal
-            
-            readiness_score = (sleep_score * 0.4 + activity_score * 0.3 + hr_score * 0.3)
-            
-            readiness_data.append({
-                'date': date,
-                'readiness_score': readiness_score,
-                'sleep_score': sleep_score,
-                'activity_score': activity_score,
-                'hr_score': hr_score
-            })
-        
-        return pd.DataFrame(readiness_data)
+        end_date = end_date or _utc_now()
+        
+        dates = pd.date_range(_naive_utc(start_date), _naive_utc(end_date), freq='D')
+        days = dates.normalize()
+        
+        # Gather required metrics with a single aggregate request, summarized
+        # server-side into one bucket per day starting at UTC midnight
+        if dates.empty:
+            datasets = _no_datasets(READINESS_DATA_TYPES)
+        else:
+            datasets = await self._aggregate(
+                READINESS_DATA_TYPES, days[0].to_pydatetime(), end_date, DAY_MILLIS)
+        sleep_df = self._parse_sleep(datasets)
+        activity_df = self._parse_activity(datasets)
+        hrv_df = self._parse_heart_rate(datasets)
+        
+        # One groupby per frame instead of masking every frame per day
+        sleep_daily = _daily(sleep_df, 'start_time', 'duration', 'sum', days).fillna(0)
+        activity_daily = _daily(activity_df, 'timestamp', 'value', 'first', days)
+        hr_daily = _daily(hrv_df, 'timestamp', 'heart_rate', 'mean', days)
+        
+        sleep = sleep_daily.to_numpy(dtype=float, na_value=np.nan)
+        activity = activity_daily.to_numpy(dtype=float, na_value=np.nan)
+        hr = hr_daily.to_numpy(dtype=float, na_value=np.nan)
+        
+        # Basic readiness score calculation
+        sleep_score = np.minimum(100, (sleep / 8) * 100)  # Optimal sleep = 8 hours
+        activity_score = np.where(np.isnan(activity), 0, np.minimum(100, activity / 30 * 100))
+        hr_score = np.where(np.isnan(hr), 50, 100 - np.abs(hr - 70))  # Assuming 70 bpm is optimal
+        
+        readiness_score = sleep_score * 0.4 + activity_score * 0.3 + hr_score * 0.3
+        
+        return pd.DataFrame({
+            'date': dates,
+            'readiness_score': readiness_score,
+            'sleep_score': sleep_score,
+            'activity_score': activity_score,
+            'hr_score': hr_score
+        })
@@ -64,14 +64,20 @@ import asyncio
 import logging
 from enum import IntEnum
 import numpy as np
+from scipy.fft import rfft, rfftfreq
+from scipy.signal import butter, sosfilt_zi
 from muselsl import stream, list_muses, view, record
 from muselsl.muse import Muse
 from pylsl import StreamInlet, resolve_byprop
-import utils
+from ._eeg_kernels import sos_filter_inplace
 
 MUSE_SAMPLING_RATE = 256  # Hz
 MUSE_EEG_CHANNELS = 4     # 5 if AUX available
 
+# 55-65 Hz band-stop around power line noise, as cascaded biquads
+NOTCH_SOS = butter(4, np.array([55, 65]) / (MUSE_SAMPLING_RATE / 2),
+                   btype='bandstop', output='sos')
+
 class Band(IntEnum):
     """EEG frequency bands in Hz.
     
@@ -104,6 +110,10 @@ class Band(IntEnum):
         }
         return ranges[self]
 
+# Contiguous band edges in Hz: Delta low, then each band's high edge
+BAND_EDGES = np.array([Band.Delta.frequency_range[0]] +
+                      [band.frequency_range[1] for band in Band])
+
 @dataclass
 class EEGConfig:
     """Configuration for EEG data processing.
@@ -212,16 +222,36 @@ class EEGProcessor:
         
         Args:
             config: Optional configuration settings. If None, uses defaults.
+            
+        Raises:
+            ValueError: If epoch_length is too short for every band to
+                contain at least one FFT bin
         """
         self.config = config or EEGConfig()
         self.muse = None
         self.inlet = None
         self.fs = MUSE_SAMPLING_RATE
         self.buffers = None
+        self._cursors = [0, 0]  # Rows ever written to each ring buffer
         self.filter_state = None
+        self._chunk_buffer = None
         self._processing = False
         self._callback = None
         
+        # Spectral analysis constants, fixed for a given epoch length
+        self._epoch_samples = int(self.config.epoch_length * self.fs)
+        self._window = np.hanning(self._epoch_samples).astype(np.float32)
+        self._window_norm = float((self._window.astype(np.float64) ** 2).sum())
+        self._band_idx = np.searchsorted(
+            rfftfreq(max(self._epoch_samples, 1), 1.0 / self.fs), BAND_EDGES)
+        # reduceat would report the next band's bin for an empty band, so
+        # every band needs at least one FFT bin
+        if np.any(np.diff(self._band_idx) == 0):
+            raise ValueError(
+                f"epoch_length {self.config.epoch_length} s is too short to "
+                "resolve every frequency band; use a longer epoch"
+            )
+        
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
 
@@ -311,6 +341,9 @@ class EEGProcessor:
             
             self.inlet = StreamInlet(streams[0])
             self.buffers = self._init_buffers()
+            self._cursors = [0, 0]
+            self._chunk_buffer = self._init_chunk_buffer()
+            self.filter_state = self._init_filter_state()
             
             self.logger.info(
                 f"Connected to Muse device\n"
@@ -343,22 +376,97 @@ class EEGProcessor:
     def _init_buffers(self) -> List:
         """Initialize EEG data buffers.
         
+        Both buffers are rings written at self._cursors, so appending is an
+        index assignment rather than a reallocation.
+        
         Returns:
-            List containing raw EEG and band power buffers
+            List containing the raw EEG buffer (samples x channels) and the
+            band power buffer (epochs x bands x channels)
         """
+        n_channels = len(self.config.channels)
+        
         # Raw EEG buffer
-        eeg_buffer = np.zeros((int(self.fs * self.config.buffer_length), 1))
+        eeg_buffer = np.zeros((int(self.fs * self.config.buffer_length), n_channels),
+                              dtype=np.float32)
         
         # Calculate number of epochs
         n_epochs = int(np.floor((self.config.buffer_length - self.config.epoch_length) /
                                self.config.shift_length + 1))
         
-        # Band power buffer for each channel
-        band_buffer = np.zeros((n_epochs, len(Band)))
+        # Band power buffer
+        band_buffer = np.zeros((n_epochs, len(Band), n_channels))
+        
+        return [eeg_buffer, band_buffer]
+
+    def _init_filter_state(self) -> np.ndarray:
+        """Initialize the notch filter state and compile its kernel.
         
-        # Create buffer list for each channel
-        return [[eeg_buffer.copy() for _ in self.config.channels],
-                [band_buffer.copy() for _ in self.config.channels]]
+        Returns:
+            Filter state of shape (sections, 2, channels)
+        """
+        n_channels = len(self.config.channels)
+        state = np.repeat(sosfilt_zi(NOTCH_SOS)[:, :, np.newaxis], n_channels, axis=2)
+        
+        # Run the kernel once on a throwaway sample so JIT compilation
+        # happens here rather than on the first streamed chunk
+        sos_filter_inplace(np.zeros((1, n_channels), dtype=np.float32),
+                           NOTCH_SOS, state.copy())
+        return state
+
+    def _append(self, buffer_idx: int, rows: np.ndarray):
+        """Write rows into a ring buffer at its cursor, wrapping around.
+        
+        Args:
+            buffer_idx: 0 for raw EEG, 1 for band powers
+            rows: New rows, oldest first
+        """
+        ring = self.buffers[buffer_idx]
+        ring[(self._cursors[buffer_idx] + np.arange(len(rows))) % len(ring)] = rows
+        self._cursors[buffer_idx] += len(rows)
+
+    def _latest(self, buffer_idx: int, n_rows: int) -> np.ndarray:
+        """Get the newest rows of a ring buffer, oldest first.
+        
+        Args:
+            buffer_idx: 0 for raw EEG, 1 for band powers
+            n_rows: Number of rows to return
+            
+        Returns:
+            Copy of the rows in time order
+        """
+        ring = self.buffers[buffer_idx]
+        rows = (self._cursors[buffer_idx] - n_rows + np.arange(n_rows)) % len(ring)
+        return np.take(ring, rows, axis=0)
+
+    def _compute_band_powers(self, epoch: np.ndarray) -> np.ndarray:
+        """Compute band powers for every channel of an epoch at once.
+        
+        Args:
+            epoch: EEG samples of shape (epoch samples, channels)
+            
+        Returns:
+            Array of shape (bands, channels), rows ordered as Band
+        """
+        spectrum = rfft(epoch * self._window[:, None], axis=0)
+        psd = (spectrum.real ** 2 + spectrum.imag ** 2) / self._window_norm
+        
+        # Sum the bins of each band in one reduction over all channels
+        return np.add.reduceat(psd[:self._band_idx[-1]], self._band_idx[:-1], axis=0)
+
+    def _init_chunk_buffer(self) -> np.ndarray:
+        """Allocate the array LSL chunks are pulled into.
+        
+        Sized to one shift of samples for every stream channel (the Muse
+        stream carries more channels than are processed), float32 to
+        match the stream's channel format.
+        
+        Returns:
+            Array of shape (shift samples, stream channels)
+        """
+        return np.empty(
+            (int(self.config.shift_length * self.fs), self.inlet.info().channel_count()),
+            dtype=np.float32
+        )
 
     async def process_chunk(self) -> Optional[Dict[str, Any]]:
         """Process a single chunk of EEG data.
@@ -373,49 +481,38 @@ class EEGProcessor:
         try:
             channel_data = {}
             
+            # Pull all channels at once, straight into the preallocated array
+            _, timestamp = self.inlet.pull_chunk(
+                timeout=1,
+                max_samples=self._chunk_buffer.shape[0],
+                dest_obj=self._chunk_buffer
+            )
+            n_samples = len(timestamp)
+            if not n_samples:
+                return channel_data
+            
+            # Notch filter the processed channels into the EEG buffer
+            chunk = self._chunk_buffer[:n_samples, self.config.channels]
+            filtered = chunk.copy()
+            sos_filter_inplace(filtered, NOTCH_SOS, self.filter_state)
+            self._append(0, filtered)
+            
+            # Get latest epoch and compute band powers for all channels
+            data_epoch = self._latest(0, self._epoch_samples)
+            band_powers = self._compute_band_powers(data_epoch)
+            self._append(1, band_powers[np.newaxis])
+            
             for idx, channel in enumerate(self.config.channels):
-                # Get EEG data chunk
-                eeg_data, timestamp = self.inlet.pull_chunk(
-                    timeout=1, 
-                    max_samples=int(self.config.shift_length * self.fs)
-                )
-                
-                if not eeg_data:
-                    continue
-                    
-                # Process channel data
-                ch_data = np.array(eeg_data)[:, channel]
-                
-                # Update EEG buffer
-                self.buffers[0][idx], self.filter_state = utils.update_buffer(
-                    self.buffers[0][idx], ch_data, 
-                    notch=True, 
-                    filter_state=self.filter_state
-                )
-                
-                # Get latest epoch
-                data_epoch = utils.get_last_data(
-                    self.buffers[0][idx],
-                    int(self.config.epoch_length * self.fs)
-                )
-                
-                # Compute band powers
-                band_powers = utils.compute_PSD(data_epoch, self.fs)
-                self.buffers[1][idx], _ = utils.update_buffer(
-                    self.buffers[1][idx], 
-                    np.asarray([band_powers])
-                )
-                
                 # Store processed data
                 channel_data[f'channel_{channel}'] = {
                     'timestamp': timestamp,
-                    'raw_data': ch_data.tolist(),
+                    'raw_data': chunk[:, idx].tolist(),
                     'band_powers': BandPowers(
-                        delta=float(band_powers[Band.Delta]),
-                        theta=float(band_powers[Band.Theta]),
-                        alpha=float(band_powers[Band.Alpha]),
-                        beta=float(band_powers[Band.Beta]),
-                        gamma=float(band_powers[Band.Gamma])
+                        delta=float(band_powers[Band.Delta, idx]),
+                        theta=float(band_powers[Band.Theta, idx]),
+                        alpha=float(band_powers[Band.Alpha, idx]),
+                        beta=float(band_powers[Band.Beta, idx]),
+                        gamma=float(band_powers[Band.Gamma, idx])
                     ).as_dict
                 }
             
@@ -460,9 +557,9 @@ class EEGProcessor:
         quality_scores = {}
         
         for idx, channel in enumerate(self.config.channels):
-            if self.buffers and len(self.buffers[0]) > idx:
+            if self.buffers:
                 # Calculate signal quality based on variance and artifact detection
-                raw_data = self.buffers[0][idx]
+                raw_data = self.buffers[0][:, idx]
                 variance = np.var(raw_data)
                 artifact_ratio = np.sum(np.abs(raw_data) > 100) / len(raw_data)
                 
@@ -478,11 +575,11 @@ class EEGProcessor:
         Returns:
             BandPowers object containing averaged values
         """
-        if not self.buffers or not self.buffers[1]:
+        if not self.buffers:
             return BandPowers(0, 0, 0, 0, 0)
             
         # Average the latest band powers across all channels
-        avg_powers = np.mean([buf[-1] for buf in self.buffers[1]], axis=0)
+        avg_powers = self._latest(1, 1)[0].mean(axis=1)
         
         return BandPowers(
             delta=float(avg_powers[Band.Delta]),
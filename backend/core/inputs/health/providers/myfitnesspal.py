@@ -61,13 +61,26 @@ Example:
 """
 
 import asyncio
+from operator import attrgetter
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Union
+import numpy as np
 import pandas as pd
 import myfitnesspal
 
 from .base import HealthDataProvider
 
+# Nutrition columns and the MyFitnessPal entry totals they are read from
+NUTRIENT_TOTALS = {
+    'calories': 'calories',
+    'protein': 'protein',
+    'carbs': 'carbohydrates',
+    'fat': 'fat',
+    'fiber': 'fiber',
+    'sodium': 'sodium',
+    'sugar': 'sugar'
+}
+
 class MyFitnessPalAdapter(HealthDataProvider):
     """Adapter for MyFitnessPal data.
     
@@ -143,7 +156,9 @@ class MyFitnessPalAdapter(HealthDataProvider):
             
         end_date = end_date or datetime.now()
         
-        nutrition_data = []
+        # Collect one list per column rather than a dict per entry
+        timestamps, meals, food_items, serving_sizes, brands = [], [], [], [], []
+        totals = {column: [] for column in NUTRIENT_TOTALS}
         current_date = start_date
         
         while current_date <= end_date:
@@ -151,25 +166,26 @@ class MyFitnessPalAdapter(HealthDataProvider):
             
             for meal in day.meals:
                 for entry in meal.entries:
-                    record = {
-                        'timestamp': current_date,
-                        'meal': meal.name,
-                        'food_item': entry.name,
-                        'serving_size': entry.serving_size,
-                        'calories': entry.totals.get('calories', 0),
-                        'protein': entry.totals.get('protein', 0),
-                        'carbs': entry.totals.get('carbohydrates', 0),
-                        'fat': entry.totals.get('fat', 0),
-                        'fiber': entry.totals.get('fiber', 0),
-                        'sodium': entry.totals.get('sodium', 0),
-                        'sugar': entry.totals.get('sugar', 0),
-                        'brand': getattr(entry, 'brand', None)
-                    }
-                    nutrition_data.append(record)
+                    timestamps.append(current_date)
+                    meals.append(meal.name)
+                    food_items.append(entry.name)
+                    serving_sizes.append(entry.serving_size)
+                    brands.append(getattr(entry, 'brand', None))
+                    entry_totals = entry.totals
+                    for column, key in NUTRIENT_TOTALS.items():
+                        totals[column].append(entry_totals.get(key, 0))
             
             current_date += timedelta(days=1)
             
-        return pd.DataFrame(nutrition_data)
+        return pd.DataFrame({
+            'timestamp': pd.to_datetime(timestamps),
+            'meal': pd.Categorical(meals),
+            'food_item': food_items,
+            'serving_size': serving_sizes,
+            **{column: np.array(values, dtype=np.float64)
+               for column, values in totals.items()},
+            'brand': brands
+        })
         
     async def get_exercise_data(self, start_date: datetime,
                              end_date: Optional[datetime] = None) -> pd.DataFrame:
@@ -196,25 +212,27 @@ class MyFitnessPalAdapter(HealthDataProvider):
             
         end_date = end_date or datetime.now()
         
-        exercise_data = []
+        read_exercise = attrgetter('name', 'duration', 'calories_burned', 'notes')
+        timestamps, rows = [], []
         current_date = start_date
         
         while current_date <= end_date:
             day = self.client.get_date(current_date)
             
-            for exercise in day.exercises:
-                record = {
-                    'timestamp': current_date,
-                    'exercise': exercise.name,
-                    'duration': exercise.duration,
-                    'calories': exercise.calories_burned,
-                    'notes': exercise.notes
-                }
-                exercise_data.append(record)
+            day_rows = list(map(read_exercise, day.exercises))
+            rows.extend(day_rows)
+            timestamps.extend([current_date] * len(day_rows))
             
             current_date += timedelta(days=1)
             
-        return pd.DataFrame(exercise_data)
+        names, durations, calories, notes = zip(*rows) if rows else ((), (), (), ())
+        return pd.DataFrame({
+            'timestamp': pd.to_datetime(timestamps),
+            'exercise': names,
+            'duration': np.array(durations, dtype=np.float64),
+            'calories': np.array(calories, dtype=np.float64),
+            'notes': notes
+        })
         
     async def get_weight_data(self, start_date: datetime,
                            end_date: Optional[datetime] = None) -> pd.DataFrame:
@@ -241,16 +259,13 @@ class MyFitnessPalAdapter(HealthDataProvider):
         
         weights = self.client.get_measurements('Weight', start_date, end_date)
         
-        weight_data = [
-            {
-                'timestamp': date,
-                'weight': weight,
-                'notes': getattr(weight, 'notes', None)
-            }
-            for date, weight in weights.items()
-        ]
-        
-        return pd.DataFrame(weight_data)
+        # Length is known up front, so each column is allocated once
+        n = len(weights)
+        return pd.DataFrame({
+            'timestamp': np.fromiter(weights.keys(), dtype='datetime64[ns]', count=n),
+            'weight': np.fromiter(weights.values(), dtype=np.float64, count=n),
+            'notes': [getattr(weight, 'notes', None) for weight in weights.values()]
+        })
         
     # These methods are not supported by MyFitnessPal
     async def get_sleep_data(self, *args, **kwargs) -> pd.DataFrame:
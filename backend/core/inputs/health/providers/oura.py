@@ -66,13 +66,31 @@ Example:
     ... )
 """
 
+import asyncio
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 import requests
 import pandas as pd
-from .base import HealthDataProvider
+from .base import HealthDataProvider, aggregate_daily
 from .shimmer_client import ShimmerClient, ShimmerEndpoint, ShimmerCredentials, ShimmerDataType
 
+# Every Shimmer data type get_readiness_data needs, fetched as one batch
+READINESS_DATA_TYPES = (
+    ShimmerDataType.SLEEP_EPISODE,
+    ShimmerDataType.SLEEP_DURATION,
+    ShimmerDataType.PHYSICAL_ACTIVITY,
+    ShimmerDataType.CALORIES_BURNED,
+    ShimmerDataType.HRV,
+    ShimmerDataType.HEART_RATE,
+    ShimmerDataType.BODY_TEMPERATURE
+)
+
+def _merge_column(df: pd.DataFrame, other: pd.DataFrame, column: str) -> pd.DataFrame:
+    """Outer-join one column of other onto df by timestamp when both have data."""
+    if df.empty or other.empty:
+        return df
+    return df.merge(other[['timestamp', column]], on='timestamp', how='outer')
+
 class OuraAdapter(HealthDataProvider):
     """Adapter for Oura Ring data using Shimmer for normalization."""
     
@@ -88,156 +106,102 @@ class OuraAdapter(HealthDataProvider):
             }
         )
     
-    def get_sleep_data(self, start_date: datetime, end_date: Optional[datetime] = None) -> pd.DataFrame:
-        """Fetch sleep data from Oura through Shimmer."""
-        sleep_df = self.client.get_data(
-            endpoint=ShimmerEndpoint.OURA,
-            data_type=ShimmerDataType.SLEEP_EPISODE,
-            start_date=start_date,
-            end_date=end_date
-        )
+    async def _fetch_many(self, data_types: Sequence[ShimmerDataType], start_date: datetime,
+                          end_date: Optional[datetime] = None) -> List[pd.DataFrame]:
+        """Fetch several Shimmer data types concurrently.
         
-        # Get additional sleep duration data
-        duration_df = self.client.get_data(
-            endpoint=ShimmerEndpoint.OURA,
-            data_type=ShimmerDataType.SLEEP_DURATION,
-            start_date=start_date,
-            end_date=end_date
-        )
+        Shimmer requests block, so each runs on the event loop's default
+        executor via asyncio.to_thread.
         
-        # Merge sleep episode and duration data
-        if not sleep_df.empty and not duration_df.empty:
-            sleep_df = sleep_df.merge(
-                duration_df[['timestamp', 'duration']],
-                on='timestamp',
-                how='outer'
+        Returns:
+            One DataFrame per requested data type, in request order
+        """
+        return list(await asyncio.gather(*(
+            asyncio.to_thread(
+                self.client.get_data,
+                endpoint=ShimmerEndpoint.OURA,
+                data_type=data_type,
+                start_date=start_date,
+                end_date=end_date
             )
-        
-        return sleep_df
+            for data_type in data_types
+        )))
     
-    def get_activity_data(self, start_date: datetime, end_date: Optional[datetime] = None) -> pd.DataFrame:
-        """Fetch activity data from Oura through Shimmer."""
-        # Get both activity and calories data
-        activity_df = self.client.get_data(
-            endpoint=ShimmerEndpoint.OURA,
-            data_type=ShimmerDataType.PHYSICAL_ACTIVITY,
-            start_date=start_date,
-            end_date=end_date
+    async def get_sleep_data(self, start_date: datetime, end_date: Optional[datetime] = None) -> pd.DataFrame:
+        """Fetch sleep data from Oura through Shimmer."""
+        # Sleep episodes and durations are fetched concurrently
+        sleep_df, duration_df = await self._fetch_many(
+            (ShimmerDataType.SLEEP_EPISODE, ShimmerDataType.SLEEP_DURATION),
+            start_date, end_date
         )
         
-        calories_df = self.client.get_data(
-            endpoint=ShimmerEndpoint.OURA,
-            data_type=ShimmerDataType.CALORIES_BURNED,
-            start_date=start_date,
-            end_date=end_date
+        # Merge sleep episode and duration data
+        return _merge_column(sleep_df, duration_df, 'duration')
+    
+    async def get_activity_data(self, start_date: datetime, end_date: Optional[datetime] = None) -> pd.DataFrame:
+        """Fetch activity data from Oura through Shimmer."""
+        # Activity and calories data are fetched concurrently
+        activity_df, calories_df = await self._fetch_many(
+            (ShimmerDataType.PHYSICAL_ACTIVITY, ShimmerDataType.CALORIES_BURNED),
+            start_date, end_date
         )
         
         # Merge activity and calories data
-        if not activity_df.empty and not calories_df.empty:
-            activity_df = activity_df.merge(
-                calories_df[['timestamp', 'calories']],
-                on='timestamp',
-                how='outer'
-            )
-        
-        return activity_df
+        return _merge_column(activity_df, calories_df, 'calories')
     
-    def get_hrv_data(self, start_date: datetime, end_date: Optional[datetime] = None) -> pd.DataFrame:
+    async def get_hrv_data(self, start_date: datetime, end_date: Optional[datetime] = None) -> pd.DataFrame:
         """Fetch HRV data from Oura through Shimmer."""
-        return self.client.get_data(
-            endpoint=ShimmerEndpoint.OURA,
-            data_type=ShimmerDataType.HRV,
-            start_date=start_date,
-            end_date=end_date
-        )
+        hrv_df, = await self._fetch_many((ShimmerDataType.HRV,), start_date, end_date)
+        return hrv_df
     
-    def get_readiness_data(self, start_date: datetime, end_date: Optional[datetime] = None) -> pd.DataFrame:
+    async def get_readiness_data(self, start_date: datetime, end_date: Optional[datetime] = None) -> pd.DataFrame:
         """Calculate readiness score using Oura data."""
-        # Get all required metrics
-        sleep_df = self.get_sleep_data(start_date, end_date)
-        activity_df = self.get_activity_data(start_date, end_date)
-        hrv_df = self.get_hrv_data(start_date, end_date)
+        # Issue every fetch in one concurrent batch, then combine in memory
+        (sleep_df, duration_df, activity_df, calories_df,
+         hrv_df, hr_df, temp_df) = await self._fetch_many(READINESS_DATA_TYPES, start_date, end_date)
+        sleep_df = _merge_column(sleep_df, duration_df, 'duration')
+        activity_df = _merge_column(activity_df, calories_df, 'calories')
         
-        # Get heart rate data
-        hr_df = self.client.get_data(
-            endpoint=ShimmerEndpoint.OURA,
-            data_type=ShimmerDataType.HEART_RATE,
-            start_date=start_date,
-            end_date=end_date
-        )
+        days = pd.date_range(start_date, end_date or datetime.now(), freq='D')
+        if days.empty:
+            return pd.DataFrame()
+            
+        # One grouped pass per frame instead of a boolean mask per day
+        day_sleep = pd.Series(aggregate_daily(sleep_df, 'duration', 'sum', days)).fillna(0)
+        day_calories = pd.Series(aggregate_daily(activity_df, 'calories', 'sum', days)).fillna(0)
+        day_hrv = pd.Series(aggregate_daily(hrv_df, 'hrv', 'mean', days))
+        day_hr = pd.Series(aggregate_daily(hr_df, 'heart_rate', 'mean', days))
+        day_temp = pd.Series(aggregate_daily(temp_df, 'temperature', 'mean', days))
         
-        # Get body temperature data (Oura-specific)
-        temp_df = self.client.get_data(
-            endpoint=ShimmerEndpoint.OURA,
-            data_type=ShimmerDataType.BODY_TEMPERATURE,
-            start_date=start_date,
-            end_date=end_date
-        )
+        # Calculate component scores, scoring missing days as neutral
+        sleep_score = (day_sleep / 8 * 100).clip(upper=100)  # Optimal sleep = 8 hours
+        activity_score = (day_calories / 600 * 100).clip(upper=100)
+        hrv_score = (day_hrv / 100 * 100).clip(upper=100).fillna(50)
+        hr_score = (100 - (day_hr - 70).abs()).fillna(50)
         
-        readiness_data = []
-        for date in pd.date_range(start_date, end_date or datetime.now(), freq='D'):
-            next_date = date + timedelta(days=1)
-            
-            # Calculate daily metrics
-            day_sleep = sleep_df[
-                (sleep_df['timestamp'] >= date) & 
-                (sleep_df['timestamp'] < next_date)
-            ]['duration'].sum() if 'duration' in sleep_df.columns else 0
-            
-            day_activity = activity_df[
-                (activity_df['timestamp'] >= date) & 
-                (activity_df['timestamp'] < next_date)
-            ]
-            
-            day_hrv = hrv_df[
-                (hrv_df['timestamp'] >= date) & 
-                (hrv_df['timestamp'] < next_date)
-            ]['hrv'].mean() if 'hrv' in hrv_df.columns else None
-            
-            day_hr = hr_df[
-                (hr_df['timestamp'] >= date) & 
-                (hr_df['timestamp'] < next_date)
-            ]['heart_rate'].mean() if 'heart_rate' in hr_df.columns else None
-            
-            day_temp = temp_df[
-                (temp_df['timestamp'] >= date) & 
-                (temp_df['timestamp'] < next_date)
-            ]['temperature'].mean() if 'temperature' in temp_df.columns else None
-            
-            # Calculate component scores
-            sleep_score = min(100, (day_sleep / 8) * 100)  # Optimal sleep = 8 hours
-            
-            activity_score = min(100, day_activity['calories'].sum() / 600 * 100) \
-                if not day_activity.empty and 'calories' in day_activity.columns else 0
-            
-            hrv_score = min(100, (day_hrv / 100) * 100) if day_hrv is not None else 50
-            hr_score = 100 - abs(day_hr - 70) if day_hr is not None else 50
-            
-            # Temperature deviation score (Oura-specific)
-            temp_score = 100 - abs(day_temp - 37) * 20 if day_temp is not None else 50  # Optimal temp = 37°C
-            
-            # Calculate weighted readiness score with temperature
-            readiness_score = (
-                sleep_score * 0.35 +
-                activity_score * 0.25 +
-                hrv_score * 0.2 +
-                hr_score * 0.1 +
-                temp_score * 0.1
-            )
-            
-            readiness_data.append({
-                'date': date,
-                'readiness_score': readiness_score,
-                'sleep_score': sleep_score,
-                'activity_score': activity_score,
-                'hrv_score': hrv_score,
-                'hr_score': hr_score,
-                'temperature_score': temp_score,
-                'sleep_duration': day_sleep,
-                'calories': day_activity['calories'].sum() if not day_activity.empty and 'calories' in day_activity.columns else 0,
-                'hrv': day_hrv,
-                'heart_rate': day_hr,
-                'temperature': day_temp
-            })
+        # Temperature deviation score (Oura-specific)
+        temp_score = (100 - (day_temp - 37).abs() * 20).fillna(50)  # Optimal temp = 37°C
+        
+        # Calculate weighted readiness score with temperature
+        readiness_score = (
+            sleep_score * 0.35 +
+            activity_score * 0.25 +
+            hrv_score * 0.2 +
+            hr_score * 0.1 +
+            temp_score * 0.1
+        )
         
-        return pd.DataFrame(readiness_data)
+        return pd.DataFrame({
+            'date': days,
+            'readiness_score': readiness_score.to_numpy(),
+            'sleep_score': sleep_score.to_numpy(),
+            'activity_score': activity_score.to_numpy(),
+            'hrv_score': hrv_score.to_numpy(),
+            'hr_score': hr_score.to_numpy(),
+            'temperature_score': temp_score.to_numpy(),
+            'sleep_duration': day_sleep.to_numpy(),
+            'calories': day_calories.to_numpy(),
+            'hrv': day_hrv.to_numpy(),
+            'heart_rate': day_hr.to_numpy(),
+            'temperature': day_temp.to_numpy()
+        })
@@ -49,13 +49,20 @@ Example:
     ... )
 """
 
+import asyncio
 from enum import Enum, auto
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 import pandas as pd
 import requests
 
+try:
+    # Optional: Arrow-backed frames concatenate without reblocking
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
 class ShimmerEndpoint(str, Enum):
     """Supported Shimmer API endpoints."""
     OURA = "oura"
@@ -81,6 +88,23 @@ class ShimmerDataType(str, Enum):
     RESPIRATORY_RATE = "respiratory_rate"
     CALORIES_BURNED = "calories_burned"
 
+# Low-cardinality string columns stored as pandas categoricals
+CATEGORICAL_COLUMNS = ("type", "activity_type", "source")
+
+# Provider payload columns kept out of the returned frames
+RAW_COLUMNS = ("metadata", "raw_data")
+
+def _records_to_frame(records: list) -> pd.DataFrame:
+    """Build a DataFrame from API records, Arrow-backed when possible."""
+    if pa is None:
+        return pd.DataFrame(records)
+    try:
+        table = pa.Table.from_pylist(records)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Mixed-type fields can't share an Arrow column; keep object dtype
+        return pd.DataFrame(records)
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
 @dataclass
 class ShimmerCredentials:
     """OAuth credentials for Shimmer API authentication.
@@ -137,6 +161,8 @@ class ShimmerClient:
                 - type: Measurement type
                 - source: Data source/provider
                 - metadata: Additional provider-specific data
+            Columns are Arrow-backed (pd.ArrowDtype) when pyarrow is
+            installed and the records have consistent types.
         
         Raises:
             ValueError: If endpoint or data type is invalid
@@ -158,7 +184,7 @@ class ShimmerClient:
         )
         response.raise_for_status()
         
-        return pd.DataFrame(response.json()["data"])
+        return _records_to_frame(response.json()["data"])
     
     def _get_auth_headers(self, endpoint: ShimmerEndpoint) -> Dict[str, str]:
         """Get authentication headers for API requests.
@@ -205,67 +231,113 @@ class ShimmerClient:
         creds.refresh_token = token_data.get("refresh_token", creds.refresh_token)
 
 class HealthDataFetcher:
-    """Fetch and aggregate health data from multiple sources using Shimmer."""
+    """Fetch and aggregate health data from multiple sources using Shimmer.
+    
+    Attributes:
+        client: Shimmer API client
+        raw_data: Provider payloads (RAW_COLUMNS) from the latest fetch of
+            each data type, row-aligned with the frame that fetch returned.
+            Kept for debugging only; the returned frames never carry them
+    """
     
     def __init__(self, shimmer_client: ShimmerClient):
         self.client = shimmer_client
+        self.raw_data: Dict[ShimmerDataType, pd.DataFrame] = {}
+    
+    async def get_endpoint_data(self,
+                                endpoint: ShimmerEndpoint,
+                                data_type: ShimmerDataType,
+                                start_date: datetime,
+                                end_date: Optional[datetime] = None) -> pd.DataFrame:
+        """Fetch one data type from one endpoint without blocking the event loop.
+        
+        The Shimmer request blocks, so it runs on the loop's default
+        executor via asyncio.to_thread.
+        """
+        return await asyncio.to_thread(
+            self.client.get_data,
+            endpoint=endpoint,
+            data_type=data_type,
+            start_date=start_date,
+            end_date=end_date
+        )
+    
+    async def fetch_with_raw(self,
+                       data_type: ShimmerDataType,
+                       endpoints: list[ShimmerEndpoint],
+                       start_date: datetime,
+                       end_date: Optional[datetime] = None,
+                       label: Optional[str] = None) -> Tuple[pd.DataFrame, Optional[pd.DataFrame]]:
+        """Fetch one data type from every endpoint concurrently.
+        
+        Endpoints that fail are reported and skipped; the rest are
+        concatenated in endpoint order, with CATEGORICAL_COLUMNS stored
+        as categoricals. Unlike the get_* methods this does not touch
+        raw_data, so concurrent calls for the same data type are safe.
+        
+        Returns:
+            Tuple of (frame without RAW_COLUMNS, RAW_COLUMNS row-aligned
+            with it); the payloads are None if every endpoint failed
+        """
+        label = label or data_type.value
+        results = await asyncio.gather(*(
+            self.get_endpoint_data(endpoint, data_type, start_date, end_date)
+            for endpoint in endpoints
+        ), return_exceptions=True)
+        dfs = []
+        raws = []
+        for endpoint, df in zip(endpoints, results):
+            if isinstance(df, Exception):
+                print(f"Error fetching {label} data from {endpoint.value}: {str(df)}")
+                continue
+            # Split payload blobs off so the concat only copies typed columns
+            raw_columns = [c for c in RAW_COLUMNS if c in df.columns]
+            raws.append(df[raw_columns].reset_index(drop=True))
+            dfs.append(df.drop(columns=raw_columns))
+        
+        if not dfs:
+            return pd.DataFrame(), None
+        
+        # Categorize after concat so frames with different value sets
+        # don't fall back to object dtype
+        df = pd.concat(dfs, ignore_index=True)
+        for column in CATEGORICAL_COLUMNS:
+            if column in df.columns:
+                df[column] = df[column].astype("category")
+        return df, pd.concat(raws, ignore_index=True)
+    
+    async def _fetch_all(self,
+                   label: str,
+                   data_type: ShimmerDataType,
+                   endpoints: list[ShimmerEndpoint],
+                   start_date: datetime,
+                   end_date: Optional[datetime] = None) -> pd.DataFrame:
+        """Fetch one data type and move its RAW_COLUMNS to raw_data[data_type]."""
+        df, raw = await self.fetch_with_raw(data_type, endpoints, start_date, end_date, label)
+        if raw is not None:
+            self.raw_data[data_type] = raw
+        return df
     
-    def get_sleep_data(self, 
+    async def get_sleep_data(self, 
                       endpoints: list[ShimmerEndpoint],
                       start_date: datetime,
                       end_date: Optional[datetime] = None) -> pd.DataFrame:
         """Fetch sleep data from multiple sources."""
-        dfs = []
-        for endpoint in endpoints:
-            try:
-                df = self.client.get_data(
-                    endpoint=endpoint,
-                    data_type=ShimmerDataType.SLEEP_EPISODE,
-                    start_date=start_date,
-                    end_date=end_date
-                )
-                dfs.append(df)
-            except Exception as e:
-                print(f"Error fetching sleep data from {endpoint.value}: {str(e)}")
-        
-        return pd.concat(dfs) if dfs else pd.DataFrame()
+        return await self._fetch_all("sleep", ShimmerDataType.SLEEP_EPISODE,
+                               endpoints, start_date, end_date)
     
-    def get_activity_data(self,
+    async def get_activity_data(self,
                          endpoints: list[ShimmerEndpoint],
                          start_date: datetime,
                          end_date: Optional[datetime] = None) -> pd.DataFrame:
         """Fetch physical activity data from multiple sources."""
-        dfs = []
-        for endpoint in endpoints:
-            try:
-                df = self.client.get_data(
-                    endpoint=endpoint,
-                    data_type=ShimmerDataType.PHYSICAL_ACTIVITY,
-                    start_date=start_date,
-                    end_date=end_date
-                )
-                dfs.append(df)
-            except Exception as e:
-                print(f"Error fetching activity data from {endpoint.value}: {str(e)}")
-        
-        return pd.concat(dfs) if dfs else pd.DataFrame()
+        return await self._fetch_all("activity", ShimmerDataType.PHYSICAL_ACTIVITY,
+                               endpoints, start_date, end_date)
     
-    def get_hrv_data(self,
+    async def get_hrv_data(self,
                      endpoints: list[ShimmerEndpoint],
                      start_date: datetime,
                      end_date: Optional[datetime] = None) -> pd.DataFrame:
         """Fetch HRV data from multiple sources."""
-        dfs = []
-        for endpoint in endpoints:
-            try:
-                df = self.client.get_data(
-                    endpoint=endpoint,
-                    data_type=ShimmerDataType.HRV,
-                    start_date=start_date,
-                    end_date=end_date
-                )
-                dfs.append(df)
-            except Exception as e:
-                print(f"Error fetching HRV data from {endpoint.value}: {str(e)}")
-        
-        return pd.concat(dfs) if dfs else pd.DataFrame()
+        return await self._fetch_all("HRV", ShimmerDataType.HRV,
+                               endpoints, start_date, end_date)
@@ -43,7 +43,7 @@ Example:
 import asyncio
 import logging
 from dataclasses import dataclass
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 
 import numpy as np
 try:
@@ -52,6 +52,9 @@ except ImportError:
     logging.error("Tobii Pro SDK not found. Please install it from https://developer.tobiipro.com/python/python-getting-started.html")
     tr = None
 
+# Columns of the gaze ring buffer shared with the attention pipeline
+GAZE_COLUMNS = ('t', 'x', 'y', 'pupil', 'valid')
+
 @dataclass
 class GazeData:
     timestamp: float
@@ -62,7 +65,16 @@ class GazeData:
     gaze_point: Optional[Dict[str, float]]
 
 class TobiiTracker:
-    def __init__(self):
+    def __init__(self, ring_capacity: int = 8192,
+                 display_fov: Tuple[float, float] = (50.0, 30.0)):
+        """Initialize the tracker.
+
+        Args:
+            ring_capacity: Number of gaze samples kept for snapshot_last()
+            display_fov: Horizontal and vertical field of view of the
+                display area in degrees, used to convert normalized gaze
+                points to visual angle
+        """
         self._eyetracker = None
         self._gaze_data_callback = None
         self._running = False
@@ -75,6 +87,18 @@ class TobiiTracker:
         }
         self._gaze_history: List[GazeData] = []
         self._max_history = 1000  # Store last 1000 gaze points
+        self._sample_rate = 120.0
+        self._fov_x, self._fov_y = display_fov
+        
+        # Gaze ring buffer, one contiguous column per field so snapshots
+        # feed the segmentation kernels without copies
+        self._gaze_ring = {
+            name: np.zeros(ring_capacity, dtype=np.uint8 if name == 'valid' else np.float64)
+            for name in GAZE_COLUMNS
+        }
+        self._ring_capacity = ring_capacity
+        self._gaze_idx = 0
+        self._gaze_count = 0
         
     async def initialize(self) -> bool:
         """Initialize connection to Tobii eye tracker."""
@@ -89,6 +113,7 @@ class TobiiTracker:
                 return False
                 
             self._eyetracker = found_eyetrackers[0]
+            self._sample_rate = float(self._eyetracker.get_gaze_output_frequency())
             logging.info(f"Connected to eye tracker with serial number {self._eyetracker.serial_number}")
             return True
             
@@ -118,6 +143,7 @@ class TobiiTracker:
             } if gaze_data['left_gaze_point_validity'] else None
         )
         
+        self._write_ring(gaze_data)
         self._gaze_history.append(data)
         if len(self._gaze_history) > self._max_history:
             self._gaze_history.pop(0)
@@ -125,6 +151,57 @@ class TobiiTracker:
         asyncio.create_task(self._gaze_data_queue.put(data))
         self._update_attention_metrics(data)
         
+    def _write_ring(self, gaze_data):
+        """Append a raw SDK sample to the gaze ring buffer.
+
+        Runs on the SDK callback thread. The sample is written before the
+        index advances, so readers never see a partially written slot.
+        """
+        ring = self._gaze_ring
+        i = self._gaze_idx
+        left_pupil_valid = gaze_data['left_pupil_diameter_validity']
+        right_pupil_valid = gaze_data['right_pupil_diameter_validity']
+        if left_pupil_valid and right_pupil_valid:
+            pupil = (gaze_data['left_pupil_diameter'] + gaze_data['right_pupil_diameter']) * 0.5
+        elif left_pupil_valid:
+            pupil = gaze_data['left_pupil_diameter']
+        elif right_pupil_valid:
+            pupil = gaze_data['right_pupil_diameter']
+        else:
+            pupil = 0.0
+        point = gaze_data['left_gaze_point_on_display_area']
+        
+        ring['t'][i] = gaze_data['system_time_stamp'] / 1000000.0
+        ring['x'][i] = point['x'] * self._fov_x
+        ring['y'][i] = point['y'] * self._fov_y
+        ring['pupil'][i] = pupil
+        ring['valid'][i] = bool(gaze_data['left_gaze_point_validity']) and (
+            bool(left_pupil_valid) or bool(right_pupil_valid)
+        )
+        self._gaze_idx = (i + 1) % self._ring_capacity
+        self._gaze_count += 1
+        
+    def snapshot_last(self, duration: float) -> Dict[str, np.ndarray]:
+        """Get the most recent gaze samples without waiting for new ones.
+        
+        Args:
+            duration: Window length in seconds
+            
+        Returns:
+            Dict of equal-length arrays keyed by GAZE_COLUMNS. When the
+            window is contiguous in the ring these are views into the
+            buffer, valid until the tracker laps the ring.
+        """
+        idx = self._gaze_idx
+        n = min(int(duration * self._sample_rate), self._gaze_count, self._ring_capacity)
+        start = idx - n
+        if start >= 0:
+            return {name: col[start:idx] for name, col in self._gaze_ring.items()}
+        return {
+            name: np.concatenate((col[start:], col[:idx]))
+            for name, col in self._gaze_ring.items()
+        }
+        
     def _update_attention_metrics(self, gaze_data: GazeData):
         """Update attention metrics based on new gaze data."""
         # Update fixation duration
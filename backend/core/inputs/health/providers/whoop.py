@@ -44,13 +44,17 @@ Example:
 """
 
 import asyncio
+import time
+from collections import deque
 import aiohttp
-from dataclasses import dataclass
-from typing import Optional, Dict, Any
+import numpy as np
+import orjson
+from dataclasses import dataclass, fields
+from typing import Optional, Dict, Any, Deque
 import logging
 from datetime import datetime, timezone
 
-@dataclass
+@dataclass(slots=True)
 class WhoopMetrics:
     """Container for Whoop biometric metrics."""
     heart_rate: float
@@ -60,24 +64,50 @@ class WhoopMetrics:
     recovery: float
     timestamp: datetime
 
+# Metrics polled individually by get_current_metrics
+CURRENT_METRICS = tuple(
+    f.name for f in fields(WhoopMetrics) if f.name != "timestamp"
+)
+
 class WhoopClient:
     """Client for interacting with the Whoop API."""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, cache_ttl: float = 0.5, hrv_window: int = 60):
         """Initialize the Whoop client.
         
         Args:
             api_key: Whoop API authentication key
+            cache_ttl: Seconds a fetched WhoopMetrics is reused for
+            hrv_window: Number of recent HRV readings kept for get_hrv()
         """
         self.api_key = api_key
         self.base_url = "https://api.whoop.com/v1"
+        self._metric_urls = tuple(
+            (metric, f"{self.base_url}/metrics/{metric}")
+            for metric in CURRENT_METRICS
+        )
         self.session: Optional[aiohttp.ClientSession] = None
         self.ws: Optional[aiohttp.ClientWebSocketResponse] = None
         self.logger = logging.getLogger(__name__)
         
+        # Short-lived cache so consumers polling in the same tick share one fetch
+        self.cache_ttl = cache_ttl
+        self._cached_metrics: Optional[WhoopMetrics] = None
+        self._cached_at = 0.0
+        self._fetch_lock = asyncio.Lock()
+        self._hrv_history: Deque[float] = deque(maxlen=hrv_window)
+        
     async def __aenter__(self):
         """Set up async context."""
+        # Keep connections alive so per-metric polls reuse TLS sessions
+        connector = aiohttp.TCPConnector(
+            limit=32,
+            limit_per_host=len(CURRENT_METRICS),
+            keepalive_timeout=60,
+            enable_cleanup_closed=True
+        )
         self.session = aiohttp.ClientSession(
+            connector=connector,
             headers={"Authorization": f"Bearer {self.api_key}"}
         )
         return self
@@ -106,23 +136,54 @@ class WhoopClient:
     async def get_current_metrics(self) -> WhoopMetrics:
         """Get current biometric metrics.
         
+        Results are reused for cache_ttl seconds, and concurrent callers
+        wait on a single in-flight request.
+        
         Returns:
             WhoopMetrics containing current biometric data
         """
         if not self.session:
             raise RuntimeError("Client session not initialized")
             
+        async with self._fetch_lock:
+            if (self._cached_metrics is not None and
+                    time.monotonic() - self._cached_at < self.cache_ttl):
+                return self._cached_metrics
+                
+            metrics = await self._fetch_current_metrics()
+            self._cached_metrics = metrics
+            self._cached_at = time.monotonic()
+            self._hrv_history.append(metrics.hrv)
+            return metrics
+            
+    async def get_hrv(self) -> np.ndarray:
+        """Get recent HRV readings, including the current one.
+        
+        Returns:
+            Array of up to hrv_window HRV values, oldest first
+        """
+        await self.get_current_metrics()
+        return np.asarray(self._hrv_history, dtype=np.float64)
+        
+    async def get_recovery(self) -> float:
+        """Get the current recovery score.
+        
+        Returns:
+            Recovery value from the latest (possibly cached) metrics
+        """
+        metrics = await self.get_current_metrics()
+        return metrics.recovery
+        
+    async def _fetch_current_metrics(self) -> WhoopMetrics:
+        """Request every current metric from the API."""
         try:
             # Parallel requests for efficiency
-            tasks = [
-                self.session.get(f"{self.base_url}/metrics/{metric}")
-                for metric in ["heart_rate", "hrv", "respiratory_rate", "strain", "recovery"]
-            ]
+            tasks = [self.session.get(url) for _, url in self._metric_urls]
             
             responses = await asyncio.gather(*tasks)
             data = {}
             
-            for response, metric in zip(responses, ["heart_rate", "hrv", "respiratory_rate", "strain", "recovery"]):
+            for response, (metric, _) in zip(responses, self._metric_urls):
                 response.raise_for_status()
                 result = await response.json()
                 data[metric] = result.get("value", 0.0)
@@ -149,17 +210,24 @@ class WhoopClient:
         if not self.ws:
             await self.connect_websocket()
             
+        # Bind hot-loop lookups once; high-rate HR/IBI streams hit this per frame
+        loads = orjson.loads
+        now = datetime.now
+        utc = timezone.utc
+        text_type = aiohttp.WSMsgType.TEXT
+        
         try:
             async for msg in self.ws:
-                if msg.type == aiohttp.WSMsgType.TEXT:
-                    data = msg.json()
+                if msg.type == text_type:
+                    data = loads(msg.data)
+                    get = data.get
                     metrics = WhoopMetrics(
-                        heart_rate=data.get("heart_rate", 0.0),
-                        hrv=data.get("hrv", 0.0),
-                        respiratory_rate=data.get("respiratory_rate", 0.0),
-                        strain=data.get("strain", 0.0),
-                        recovery=data.get("recovery", 0.0),
-                        timestamp=datetime.now(timezone.utc)
+                        get("heart_rate", 0.0),
+                        get("hrv", 0.0),
+                        get("respiratory_rate", 0.0),
+                        get("strain", 0.0),
+                        get("recovery", 0.0),
+                        now(utc)
                     )
                     await callback(metrics)
                 elif msg.type == aiohttp.WSMsgType.ERROR:
@@ -117,11 +117,11 @@ class HealthDataSyncService:
             bool indicating sync success
         """
         try:
-            df = provider.get_sleep_data(start_date, end_date)
+            df = await provider.get_sleep_data(start_date, end_date)
             if df.empty:
                 return False
 
-            for _, row in df.iterrows():
+            for row in df.to_dict('records'):
                 metrics = {
                     'user_id': user_id,
                     'date': row.get('date') or row.get('timestamp'),
@@ -157,11 +157,11 @@ class HealthDataSyncService:
             bool indicating sync success
         """
         try:
-            df = provider.get_activity_data(start_date, end_date)
+            df = await provider.get_activity_data(start_date, end_date)
             if df.empty:
                 return False
 
-            for _, row in df.iterrows():
+            for row in df.to_dict('records'):
                 metrics = {
                     'user_id': user_id,
                     'timestamp': row.get('timestamp'),
@@ -195,12 +195,14 @@ class HealthDataSyncService:
         """
         try:
             # Combine HRV and readiness data for comprehensive biometrics
-            hrv_df = provider.get_hrv_data(start_date, end_date)
-            readiness_df = provider.get_readiness_data(start_date, end_date)
+            hrv_df, readiness_df = await asyncio.gather(
+                provider.get_hrv_data(start_date, end_date),
+                provider.get_readiness_data(start_date, end_date)
+            )
             
             # Process HRV data
             if not hrv_df.empty:
-                for _, row in hrv_df.iterrows():
+                for row in hrv_df.to_dict('records'):
                     metrics = {
                         'user_id': user_id,
                         'timestamp': row.get('timestamp'),
@@ -211,7 +213,7 @@ class HealthDataSyncService:
 
             # Process readiness data
             if not readiness_df.empty:
-                for _, row in readiness_df.iterrows():
+                for row in readiness_df.to_dict('records'):
                     metrics = {
                         'user_id': user_id,
                         'timestamp': row.get('timestamp'),
@@ -243,11 +245,11 @@ class HealthDataSyncService:
             if not hasattr(provider, 'get_nutrition_data'):
                 return False
 
-            df = provider.get_nutrition_data(start_date, end_date)
+            df = await provider.get_nutrition_data(start_date, end_date)
             if df.empty:
                 return False
 
-            for _, row in df.iterrows():
+            for row in df.to_dict('records'):
                 metrics = {
                     'user_id': user_id,
                     'timestamp': row.get('timestamp'),
@@ -282,11 +284,11 @@ class HealthDataSyncService:
             if not hasattr(provider, 'get_readiness_data'):
                 return False
 
-            df = provider.get_readiness_data(start_date, end_date)
+            df = await provider.get_readiness_data(start_date, end_date)
             if df.empty:
                 return False
 
-            for _, row in df.iterrows():
+            for row in df.to_dict('records'):
                 metrics = {
                     'user_id': user_id,
                     'timestamp': row.get('timestamp'),
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+from core.algorithms.flow._gaze_kernels import (
+    segment_gaze, filter_blinks, FIXATION, SACCADE, BLINK
+)
+from core.algorithms.flow._recovery_kernels import coefficient_of_variation
+from core.algorithms.flow.history import MetricHistory
+
+def _gaze_window(n=600, seed=0):
+    """Random walk gaze with a few saccade jumps and invalid runs."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(n) / 120.0
+    x = np.cumsum(rng.normal(0, 0.02, n))
+    y = np.cumsum(rng.normal(0, 0.02, n))
+    jumps = rng.choice(n, 12, replace=False)
+    x[jumps] += rng.normal(0, 3, 12)
+    valid = np.ones(n, dtype=np.uint8)
+    for start in rng.choice(n - 20, 6, replace=False):
+        valid[start:start + rng.integers(1, 20)] = 0
+    return t, x, y, valid
+
+def _segment(kernel, t, x, y, valid, v_thresh=30.0):
+    n = len(t)
+    starts = np.empty(n, dtype=np.int32)
+    ends = np.empty(n, dtype=np.int32)
+    kind = np.empty(n, dtype=np.int8)
+    velocity = np.empty(n, dtype=np.float64)
+    count = kernel(t, x, y, valid, v_thresh, starts, ends, kind, velocity)
+    return starts[:count], ends[:count], kind[:count], velocity[:count]
+
+def test_segment_gaze_known_sequence():
+    """A fixation, a saccade, a blink and a trailing fixation."""
+    t = np.arange(10) / 100.0
+    x = np.array([0, 0, 0, 5, 10, 10, 10, 10, 10, 10], dtype=np.float64)
+    y = np.zeros(10)
+    valid = np.array([1, 1, 1, 1, 1, 0, 0, 1, 1, 1], dtype=np.uint8)
+    starts, ends, kind, velocity = _segment(segment_gaze, t, x, y, valid)
+    
+    assert list(kind) == [FIXATION, SACCADE, BLINK, FIXATION]
+    assert list(starts) == [0, 2, 5, 7]
+    assert list(ends) == [2, 4, 7, 9]
+    np.testing.assert_allclose(velocity, [0.0, 500.0, 0.0, 0.0])
+
+def test_segment_gaze_cython_matches_numba():
+    gaze_cy = pytest.importorskip("core.algorithms.flow._gaze_cy")
+    t, x, y, valid = _gaze_window()
+    for expected, actual in zip(_segment(segment_gaze, t, x, y, valid),
+                                _segment(gaze_cy.segment_gaze, t, x, y, valid)):
+        np.testing.assert_allclose(actual, expected)
+
+def test_filter_blinks_matches_mask():
+    t, x, y, valid = _gaze_window()
+    starts, ends, kind, _ = _segment(segment_gaze, t, x, y, valid)
+    starts, ends = starts[kind == BLINK], ends[kind == BLINK]
+    
+    out_starts = np.empty_like(starts)
+    out_ends = np.empty_like(ends)
+    count = filter_blinks(starts, ends, t, 0.05, out_starts, out_ends)
+    
+    keep = t[np.minimum(ends, len(t) - 1)] - t[starts] >= 0.05
+    np.testing.assert_array_equal(out_starts[:count], starts[keep])
+    np.testing.assert_array_equal(out_ends[:count], ends[keep])
+
+def test_coefficient_of_variation_matches_numpy():
+    x = np.random.default_rng(1).normal(50.0, 8.0, 64)
+    assert coefficient_of_variation(x) == pytest.approx(np.std(x) / np.mean(x))
+    assert coefficient_of_variation(np.array([-1.0, 1.0])) == np.inf
+
+def test_metric_history_window_variance_matches_numpy():
+    values = np.random.default_rng(2).random(1000)
+    history = MetricHistory(capacity=64, window=10)
+    for i, value in enumerate(values):
+        history.append(value)
+        if i + 1 < history.window:
+            assert history.window_variance() == 0.0
+        else:
+            window = values[i + 1 - history.window:i + 1]
+            assert history.window_variance() == pytest.approx(np.var(window), abs=1e-12)
+    
+    np.testing.assert_array_equal(history.recent(40), values[-40:])
+    assert len(history) == 64
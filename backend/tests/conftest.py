@@ -0,0 +1,15 @@
+"""Shared pytest setup for the backend tests.
+
+Test modules import the package both as ``backend.core`` and, like the
+application code itself, as ``core``; put the repository root and the
+backend directory on sys.path so both resolve without an install.
+"""
+
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+for path in (BACKEND_DIR.parent, BACKEND_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
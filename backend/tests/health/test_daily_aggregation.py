@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+import pytest
+from core.inputs.health.providers.base import aggregate_daily
+
+def _reference(df, column, how, days):
+    """Boolean mask per [day, day + 1 day) window, as before the rewrite."""
+    out = []
+    for day in days:
+        in_day = (df['timestamp'] >= day) & (df['timestamp'] < day + pd.Timedelta(days=1))
+        values = df.loc[in_day, column].dropna()
+        out.append(np.nan if values.empty else getattr(values, how)())
+    return np.array(out, dtype=np.float64)
+
+@pytest.fixture
+def samples():
+    rng = np.random.default_rng(0)
+    n = 500
+    # Spans a day before and after the requested range
+    ts = pd.Timestamp('2024-03-01') + pd.to_timedelta(rng.uniform(0, 9, n), unit='D')
+    values = rng.normal(50, 10, n)
+    values[rng.choice(n, 40, replace=False)] = np.nan
+    ts = pd.Series(ts)
+    ts[rng.choice(n, 20, replace=False)] = pd.NaT
+    return pd.DataFrame({'timestamp': ts, 'value': values}).sample(frac=1, random_state=1)
+
+@pytest.mark.parametrize('how', ['sum', 'mean'])
+def test_aggregate_daily_matches_mask_reference(samples, how):
+    # Non-midnight start, so bins run 07:30 to 07:30
+    days = pd.date_range('2024-03-02 07:30', '2024-03-08', freq='D')
+    np.testing.assert_allclose(aggregate_daily(samples, 'value', how, days),
+                               _reference(samples, 'value', how, days))
+
+def test_aggregate_daily_empty_days_and_missing_column(samples):
+    days = pd.date_range('2024-04-01', periods=3, freq='D')
+    assert np.isnan(aggregate_daily(samples, 'value', 'sum', days)).all()
+    assert np.isnan(aggregate_daily(samples, 'missing', 'mean', days)).all()
+    assert np.isnan(aggregate_daily(pd.DataFrame(), 'value', 'mean', days)).all()
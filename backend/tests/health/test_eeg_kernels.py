@@ -0,0 +1,16 @@
+import numpy as np
+from scipy import signal
+from core.inputs.health.providers._eeg_kernels import sos_filter_inplace
+
+def test_sos_filter_matches_scipy_across_chunks():
+    """Chunked in-place filtering equals one sosfilt pass over the stream."""
+    sos = signal.butter(4, [55, 65], btype='bandstop', fs=256, output='sos')
+    x = np.random.default_rng(0).normal(0, 20, (1024, 4))
+    expected = signal.sosfilt(sos, x, axis=0)
+    
+    zi = np.zeros((sos.shape[0], 2, x.shape[1]))
+    out = x.copy()
+    for start in range(0, len(out), 12):
+        sos_filter_inplace(out[start:start + 12], sos, zi)
+    
+    np.testing.assert_allclose(out, expected, rtol=1e-9, atol=1e-9)
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+google_fit = pytest.importorskip("core.inputs.health.providers.google_fit")
+
+def _reference(heart_rate, window):
+    """Windowed RMSSD/SDNN recomputed from scratch for every row."""
+    n = len(heart_rate)
+    rmssd = np.full(n, np.nan)
+    sdnn = np.full(n, np.nan)
+    for end in range(window, n + 1):
+        bpm = heart_rate[end - window:end]
+        if np.any(bpm <= 0):
+            continue
+        rr = 60000.0 / bpm
+        rmssd[end - 1] = np.sqrt(np.mean(np.diff(rr) ** 2))
+        sdnn[end - 1] = np.std(rr)
+    return rmssd, sdnn
+
+@pytest.mark.parametrize('window', [2, 5, 12])
+def test_estimate_hrv_matches_windowed_loop(window):
+    heart_rate = np.random.default_rng(0).normal(65, 6, 60)
+    heart_rate[30] = 0.0  # Dropout: every window covering it is NaN
+    rmssd, sdnn = google_fit._estimate_hrv(heart_rate, window)
+    expected_rmssd, expected_sdnn = _reference(heart_rate, window)
+    
+    assert np.isnan(rmssd[:window - 1]).all() and np.isnan(sdnn[:window - 1]).all()
+    np.testing.assert_allclose(rmssd, expected_rmssd, rtol=1e-9)
+    np.testing.assert_allclose(sdnn, expected_sdnn, rtol=1e-6)
+
+def test_estimate_hrv_shorter_than_window():
+    rmssd, sdnn = google_fit._estimate_hrv(np.array([60.0, 62.0, 61.0]), 5)
+    assert rmssd.shape == sdnn.shape == (3,)
+    assert np.isnan(rmssd).all() and np.isnan(sdnn).all()
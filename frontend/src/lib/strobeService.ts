@@ -7,6 +7,7 @@ interface StrobePattern {
 export class StrobeService {
   private ws: WebSocket | null = null;
   private readonly wsUrl: string;
+  private readonly encoder = new TextEncoder();
 
   constructor() {
     this.wsUrl = 'ws://localhost:8000/ws/eeg';
@@ -45,7 +46,7 @@ export class StrobeService {
     gamma: number;
   }) {
     if (this.ws && this.ws.readyState === WebSocket.OPEN) {
-      this.ws.send(JSON.stringify(data));
+      this.ws.send(this.encoder.encode(JSON.stringify(data)));
     }
   }
 